@@ -1,11 +1,20 @@
 # app.py
 import streamlit as st
-from src.data_loader import load_and_process_data, generate_sample_data
+import pandas as pd
+from src.data_loader import load_and_process_data, load_streaming, load_many, list_data_files, upsert_tasks, generate_sample_data, DATA_ROOT
+from src.snapshots import record_snapshot, snapshot_key
+from src.dedup import get_duplicates
+from src.search import search_rows
+from src.filters import filter_rows, facet_counts, get_facet_index
+from src.table import render_paged_table
 from src.kpi import display_kpi_dashboard, render_gantt_timeline
 from src.chatbot import chatbot_interface
-from src.analysis import data_quality_section, render_risk_heatmap, quick_risk_detection
+from src.risk_rules import parse_rules
+from src.analysis import data_quality_section, render_risk_heatmap, quick_risk_detection, render_risk_table, render_blocked_impact
 from src.reports import reports_section, export_report_html, export_report_pdf_optional
-from src.utils import set_page_config, apply_custom_css, style_metric_card, save_df_to_excel
+from src.utils import set_page_config, apply_custom_css, style_metric_card
+from src.export import start_export, available_formats, render_export_jobs
+from src.semantic import semantic_search_section
 
 # -------------------------
 # Page config & CSS
@@ -17,10 +26,19 @@ apply_custom_css()
 with st.sidebar:
     st.title("AI Project Assistant")
     st.caption("📊 Upload data, ask the AI, export reports, and visualize KPIs.")
-    uploaded_file = st.file_uploader("Upload project CSV/JSON/XLSX", type=["csv", "json", "xlsx"])
+    uploaded_files = st.file_uploader("Upload project CSV/JSON/XLSX", type=["csv", "json", "jsonl", "xlsx"], accept_multiple_files=True)
+    uploaded_file = uploaded_files[0] if len(uploaded_files or []) == 1 else None
+    folder = st.text_input("...or load every export in a folder", placeholder="exports",
+                           help=f"A folder inside {DATA_ROOT}")
+    load_folder = st.button("Load folder", disabled=not folder)
+    streaming = st.checkbox("Streaming ingestion (large CSV/JSONL)", value=False,
+                            help="Reads the file in bounded chunks to keep memory flat on very large exports.")
+    apply_delta = st.checkbox("Apply upload as delta (upsert by Task ID)", value=False,
+                              help="Diffs the upload against the loaded data and only applies inserted, updated and deleted tasks.")
+    sample_size = st.select_slider("Sample size", options=[100, 1_000, 10_000, 100_000, 1_000_000], value=100)
     if st.button("Load sample data"):
-        st.session_state.project_data = generate_sample_data()
-        st.success("Sample data loaded (100 tasks).")
+        st.session_state.project_data = generate_sample_data(sample_size, now=pd.Timestamp.now())
+        st.success(f"Sample data loaded ({sample_size:,} tasks).")
 
     st.divider()
     st.markdown("### UI")
@@ -31,6 +49,17 @@ with st.sidebar:
     model_choice = st.selectbox("Model (for LLM calls)", ["gpt-4", "gpt-4o-mini", "mistral-7b"], index=0)
     st.session_state.model_choice = model_choice
 
+    st.markdown("### Risk")
+    risk_sensitivity = st.slider("Risk Sensitivity", 1, 5, 3,
+                                 help="Scales rule thresholds: higher flags overload and lateness earlier.")
+    rules_file = st.file_uploader("Custom risk rules (JSON/YAML)", type=["json", "yaml", "yml"])
+    risk_rules = None
+    if rules_file is not None:
+        try:
+            risk_rules = parse_rules(rules_file.getvalue().decode("utf-8"), rules_file.name)
+        except Exception as e:
+            st.error(f"Could not read risk rules: {e}")
+
     st.markdown("### Quick Filters")
     st.session_state.filter_overdue = st.checkbox("Show only overdue tasks", value=False)
     st.session_state.filter_blocked = st.checkbox("Show only blocked tasks", value=False)
@@ -40,15 +69,70 @@ st.divider()
 # Load uploaded file (if any)
 if uploaded_file:
     try:
-        df = load_and_process_data(uploaded_file)
-        st.session_state.project_data = df
+        # ingest once per file; reruns reuse the session copy
+        file_key = (uploaded_file.name, uploaded_file.size, streaming, apply_delta)
+        if st.session_state.get("loaded_file") != file_key:
+            if streaming:
+                bar = st.sidebar.progress(0.0, text="Streaming upload...")
+                df = load_streaming(uploaded_file, progress=lambda rows, frac: bar.progress(frac, text=f"{rows:,} rows read"))
+                bar.empty()
+            else:
+                df = load_and_process_data(uploaded_file)
+            current = st.session_state.get("project_data", None)
+            if apply_delta and current is not None:
+                df, changes = upsert_tasks(current, df)
+                st.session_state.last_delta = changes
+                # a delta extends the current project, so its history stays in the same store
+                df.attrs["snapshot_key"] = snapshot_key(current)
+            else:
+                df.attrs["snapshot_key"] = snapshot_key(df, uploaded_file.name)
+            st.session_state.project_data = df
+            st.session_state.loaded_file = file_key
+            record_snapshot(df)
+        df = st.session_state.project_data
         st.success(f"Loaded {len(df)} rows.")
+        delta = st.session_state.get("last_delta", None)
+        if apply_delta and delta is not None:
+            st.caption(f"Delta: +{len(delta['inserted'])} inserted • ~{len(delta['updated'])} updated • -{len(delta['deleted'])} deleted")
     except Exception as e:
         st.error(f"Error loading file: {e}")
 
+# Several files or a folder: parse in parallel across cores and tag rows with their Source file
+portfolio = None
+if uploaded_files and len(uploaded_files) > 1:
+    portfolio = [(f.name, f.getvalue()) for f in uploaded_files]
+elif load_folder:
+    try:
+        portfolio = list_data_files(folder)
+        if not portfolio:
+            st.warning(f"No CSV/JSON/XLSX files found in {folder}")
+    except ValueError as e:
+        st.error(str(e))
+if portfolio:
+    portfolio_key = tuple(str(p[0] if isinstance(p, tuple) else p) for p in portfolio)
+    if load_folder or st.session_state.get("loaded_file") != portfolio_key:
+        try:
+            with st.spinner(f"Parsing {len(portfolio)} files in parallel..."):
+                st.session_state.project_data = load_many(portfolio)
+            st.session_state.loaded_file = portfolio_key
+            record_snapshot(st.session_state.project_data)
+        except Exception as e:
+            st.error(f"Error loading files: {e}")
+    if st.session_state.get("loaded_file") == portfolio_key:
+        st.success(f"Loaded {len(st.session_state.project_data)} rows from {len(portfolio)} files.")
+
 # Grab df from session if available
 df = st.session_state.get("project_data", None)
 
+# Review how upload headers were mapped onto the expected schema
+mapping = df.attrs.get("schema_mapping") if df is not None else None
+if mapping:
+    with st.sidebar.expander("Column mapping"):
+        st.dataframe(
+            pd.DataFrame([{"Header": h, "Mapped to": m["target"] or "—", "Score": m["score"]} for h, m in mapping.items()]),
+            use_container_width=True, hide_index=True
+        )
+
 # Tabs
 tabs = st.tabs(["📊 Dashboard", "🔎 Explorer", "📅 Timeline", "🔥 Risks", "💬 AI Chat", "📋 Reports"])
 
@@ -63,42 +147,51 @@ with tabs[1]:
     if df is None:
         st.info("Upload or load sample data to explore tasks.")
     else:
-        # Quick filters
+        # Quick filters: facet indexes are built once per dataset version; option labels carry the
+        # count each value would have under the other active filters
+        facet_keys = {"Status": "ex_status", "Assignee": "ex_assignee", "Epic": "ex_epic"}
+        search_q = st.session_state.get("ex_search", "")
+        search_hits = search_rows(df, search_q) if search_q else None
+        toggles = {"overdue": st.session_state.filter_overdue, "blocked": st.session_state.filter_blocked}
+        facet_ix = get_facet_index(df)
+        options = {col: sorted(facet_ix.labels[col][facet_ix.counts(col) > 0].tolist()) for col in facet_keys}
+        for col, key in facet_keys.items():
+            # drop selections that no longer exist after loading another dataset
+            st.session_state[key] = [v for v in st.session_state.get(key, []) if v in options[col]]
+        selected = {col: st.session_state[key] for col, key in facet_keys.items()}
         cols = st.columns([2,2,2,2])
-        status_filter = cols[0].multiselect("Status", options=sorted(df["Status"].dropna().unique().tolist()), default=None)
-        assignee_filter = cols[1].multiselect("Assignee", options=sorted(df["Assignee"].dropna().unique().tolist()), default=None)
-        epic_filter = cols[2].multiselect("Epic", options=sorted(df["Epic"].dropna().unique().tolist()), default=None)
-        search_q = cols[3].text_input("Search (title/desc)")
-
-        # Apply filters
-        df_view = df.copy()
-        if status_filter:
-            df_view = df_view[df_view["Status"].isin(status_filter)]
-        if assignee_filter:
-            df_view = df_view[df_view["Assignee"].isin(assignee_filter)]
-        if epic_filter:
-            df_view = df_view[df_view["Epic"].isin(epic_filter)]
-        if search_q:
-            df_view = df_view[df_view["Task"].str.contains(search_q, case=False, na=False) | df_view.get("Description", "").astype(str).str.contains(search_q, case=False, na=False)]
-
-        # Quick toggles (from sidebar)
-        if st.session_state.filter_overdue and "Due Date" in df_view.columns:
-            df_view = df_view[df_view["Due Date"] < pd.Timestamp.now()]
-        if st.session_state.filter_blocked and "Status" in df_view.columns:
-            df_view = df_view[df_view["Status"].str.lower() == "blocked"]
-
-        st.markdown(f"Showing **{len(df_view)}** rows")
-        st.dataframe(df_view.reset_index(drop=True), use_container_width=True)
-
-        # Export
-        colx1, colx2 = st.columns([1,1])
-        with colx1:
-            if st.button("Export CSV"):
-                st.download_button("Download CSV", df_view.to_csv(index=False).encode("utf-8"), "project_export.csv")
+        for i, (col, key) in enumerate(facet_keys.items()):
+            counts = facet_counts(df, col, selected, search_hits, **toggles)
+            cols[i].multiselect(col, options=options[col], key=key, format_func=lambda v, c=counts: f"{v} ({int(c.get(v, 0)):,})")
+        cols[3].text_input("Search (title/desc)", key="ex_search", help="Matches tasks containing every word; words match by prefix ('log' finds 'login').")
+
+        # Planner applies the most selective filter first and returns row positions, not a copy
+        rows, plan = filter_rows(df, selected, search_hits, **toggles)
+        if plan:
+            st.caption("Filter plan: " + " → ".join(f"{name} ({n:,})" for name, n in plan))
+
+        st.markdown(f"Showing **{len(rows):,}** rows")
+        with st.expander("🧬 Near-duplicate tasks"):
+            dups = get_duplicates(df)
+            if dups.empty:
+                st.success("No near-duplicates found")
+            else:
+                st.caption(f"{dups['Cluster'].nunique():,} clusters • {int((~dups['Canonical']).sum()):,} tasks duplicate an earlier one "
+                           "(MinHash/LSH over Task + Description)")
+                largest = dups.sort_values(["Size","Cluster","Canonical"], ascending=[False, True, False])
+                st.dataframe(largest.head(500).reset_index(drop=True), use_container_width=True)
+        render_paged_table(df, rows, key="ex_table")
+
+        # Export: chunked writer in a background thread, one temp artifact per request
+        colx1, colx2 = st.columns([1,2])
+        export_fmt = colx1.selectbox("Export format", available_formats(), key="ex_export_fmt")
+        if colx1.button(f"Export {len(rows):,} rows"):
+            job = start_export(df, rows, export_fmt)
+            st.session_state.setdefault("export_jobs", []).append(job.id)
         with colx2:
-            if st.button("Export Excel"):
-                path = save_df_to_excel(df_view, "outputs/reports/project_export.xlsx")
-                st.success(f"Saved to {path}")
+            render_export_jobs()
+
+        semantic_search_section(df)
 
 # ---------- Timeline (Gantt) ----------
 with tabs[2]:
@@ -114,10 +207,18 @@ with tabs[3]:
     if df is None:
         st.info("Upload data to detect risks.")
     else:
+        data_quality_section()
         render_risk_heatmap(df)
         st.markdown("### Quick risk detector")
-        risks = quick_risk_detection(df)
-        st.json(risks)
+        try:
+            risks = quick_risk_detection(df, risk_sensitivity, risk_rules)
+        except Exception as e:
+            # user rules can fail in many ways on a given dataset; fall back to the built-in rules
+            st.error(f"Risk rules failed to evaluate: {e}")
+            risks = quick_risk_detection(df, risk_sensitivity)
+        render_risk_table(risks)
+        st.markdown("### Blocked task blast radius")
+        render_blocked_impact(df)
 
 # ---------- Chat ----------
 with tabs[4]:
@@ -1,9 +1,27 @@
 # src/__init__.py
 __all__ = [
     "analysis",
+    "cache",
     "chatbot",
+    "cube",
     "data_loader",
+    "dedup",
+    "dependencies",
+    "export",
+    "filters",
+    "forecast",
     "kpi",
+    "quality",
     "reports",
-    "utils"
+    "retrieval",
+    "risk_rules",
+    "schema_match",
+    "search",
+    "semantic",
+    "snapshots",
+    "synthetic",
+    "table",
+    "text",
+    "utils",
+    "vector_store"
 ]
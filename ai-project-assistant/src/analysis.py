@@ -1,54 +1,109 @@
 # src/analysis.py
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
+from typing import Optional
+from src.data_loader import dataset_version, DEPENDENCY_COLUMN
+from src.risk_rules import RiskEngine, SEVERITY_LEVELS
+from src.dependencies import get_dependency_analysis
+from src.quality import profile_quality, QUALITY_SAMPLE_ROWS
+from src.utils import style_metric_card
 
-def get_data_quality_metrics(df: pd.DataFrame = None) -> dict:
-    # If df provided, compute real metrics; otherwise return placeholders
-    if df is None:
-        return {"Completeness":98.5, "Accuracy":96.2, "Consistency":94.8, "Timeliness":99.1}
-    # Completeness: fraction of non-null mandatory columns
-    mandatory = ["Task ID","Task","Status","Assignee","Due Date"]
-    present = sum(df[c].notna().sum() for c in mandatory)
-    completeness = round(present / (len(df)*len(mandatory)) * 100, 1) if len(df)>0 else 0
-    # Dummy accuracy/consistency:
-    return {"Completeness":completeness, "Accuracy":95.0, "Consistency":94.0, "Timeliness":98.0}
+def get_data_quality_metrics(df: pd.DataFrame = None, sample_rows: Optional[int] = None) -> dict:
+    # metric -> score (%); profiled once per dataset version
+    if df is None or df.empty:
+        return {}
+    return {k: v["score"] for k, v in _cached_quality(df, dataset_version(df), sample_rows, pd.Timestamp.now().floor("h"))["metrics"].items()}
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_quality(_df: pd.DataFrame, version: str, sample_rows: Optional[int], hour: pd.Timestamp) -> dict:
+    return profile_quality(_df, sample_rows, now=hour)
 
 def data_quality_section():
     st.subheader("🧪 Data Quality Assessment")
     df = st.session_state.get("project_data", None)
-    qc = get_data_quality_metrics(df)
-    cols = st.columns(4)
-    i = 0
-    for k,v in qc.items():
-        cols[i].markdown(f"<div style='padding:12px;border-radius:8px;background:#fff'><b>{k}</b><div style='font-size:22px'>{v}%</div></div>", unsafe_allow_html=True)
-        i += 1
+    if df is None or df.empty:
+        st.info("Upload data to profile its quality.")
+        return
+    sampled = st.checkbox(f"Sample {QUALITY_SAMPLE_ROWS:,} rows (faster, approximate)", value=len(df) > QUALITY_SAMPLE_ROWS,
+                          disabled=len(df) <= QUALITY_SAMPLE_ROWS, key="quality_sampled")
+    profile = _cached_quality(df, dataset_version(df), QUALITY_SAMPLE_ROWS if sampled else None, pd.Timestamp.now().floor("h"))
+    cols = st.columns(len(profile["metrics"]))
+    for col, (k, m) in zip(cols, profile["metrics"].items()):
+        with col:
+            style_metric_card(k, f"{m['score']}%", f"± {m['margin']}%" if m["margin"] else "exact")
+    if profile["checked"] < profile["rows"]:
+        st.caption(f"Estimated from {profile['checked']:,} of {profile['rows']:,} rows (95% margins); duplicate IDs and parse failures are exact.")
+    if not profile["issues"].empty:
+        with st.expander(f"Issues ({len(profile['issues'])} checks)"):
+            st.dataframe(profile["issues"], use_container_width=True, hide_index=True)
 
 def render_risk_heatmap(df: pd.DataFrame):
     st.markdown("### Risk Heatmap by Priority & Status")
     if df is None or df.empty:
         st.info("Upload data to see heatmap")
         return
-    risks = df.groupby(["Priority","Status"]).size().reset_index(name="Count")
+    risks = df.groupby(["Priority","Status"], observed=True).size().reset_index(name="Count")
     fig = px.density_heatmap(risks, x="Status", y="Priority", z="Count", color_continuous_scale="Reds")
     fig.update_layout(template="plotly_white", height=420)
     st.plotly_chart(fig, use_container_width=True)
 
-def quick_risk_detection(df: pd.DataFrame) -> list:
-    out = []
+RISK_COLUMNS = ["task_id","risk_type","severity","assignee","explanation"]
+RISK_PAGE_SIZE = 50
+
+def _risk_frame(task_id, risk_type: str, severity, assignee, explanation) -> pd.DataFrame:
+    return pd.DataFrame({
+        "task_id": task_id,
+        "risk_type": risk_type,
+        "severity": pd.Categorical.from_codes(np.asarray(severity, dtype=np.int8), categories=SEVERITY_LEVELS, ordered=True),
+        "assignee": assignee,
+        "explanation": explanation
+    })
+
+def quick_risk_detection(df: pd.DataFrame, sensitivity: int = 3, rules: Optional[list] = None) -> pd.DataFrame:
+    # rule table (DEFAULT_RULES unless a custom file is loaded) compiled once per sensitivity/rules, cached per version
     if df is None or df.empty:
-        return out
-    # Overdue
-    overdue_rows = df[(df["Due Date"].notna()) & (df["Due Date"] < pd.Timestamp.now()) & (df["Status"].str.lower() != "done")]
-    for _, r in overdue_rows.iterrows():
-        out.append({"task_id": r["Task ID"], "risk": "Overdue", "explanation": f"Due {r['Due Date'].date()} (status {r['Status']})"})
-    # Blocked
-    blocked = df[df["Status"].str.lower() == "blocked"]
-    for _, r in blocked.iterrows():
-        out.append({"task_id": r["Task ID"], "risk": "Blocked", "explanation": r.get("Description","")[:120]})
-    # Overloaded assignees
-    counts = df[df["Status"].str.lower()=="in progress"].groupby("Assignee").size()
-    for name, cnt in counts.items():
-        if cnt > 6:
-            out.append({"assignee": name, "risk": "Overloaded", "explanation": f"{cnt} tasks In Progress"})
-    return out
+        return _risk_frame([], "", [], [], [])
+    return _cached_risks(df, dataset_version(df), int(sensitivity), rules, pd.Timestamp.now().floor("min"))
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_risks(_df: pd.DataFrame, version: str, sensitivity: int, rules: Optional[list], minute: pd.Timestamp) -> pd.DataFrame:
+    return RiskEngine(rules, sensitivity).evaluate(_df, minute)
+
+def render_risk_table(risks: pd.DataFrame, page_size: int = RISK_PAGE_SIZE):
+    # summary counts plus one page of the risk table; only the visible page is sent to the browser
+    if risks is None or risks.empty:
+        st.success("No risks detected")
+        return
+    summary = risks.groupby(["risk_type","severity"], observed=True).size().unstack(fill_value=0)
+    st.dataframe(summary, use_container_width=True)
+    c1, c2, c3 = st.columns([2, 2, 1])
+    types = c1.multiselect("Risk type", options=sorted(risks["risk_type"].unique().tolist()), key="risk_types")
+    sevs = c2.multiselect("Severity", options=SEVERITY_LEVELS, key="risk_severity")
+    view = risks
+    if types:
+        view = view[view["risk_type"].isin(types)]
+    if sevs:
+        view = view[view["severity"].isin(sevs)]
+    pages = max(1, -(-len(view) // page_size))
+    page = c3.number_input("Page", min_value=1, max_value=pages, value=1, key="risk_page")
+    st.caption(f"{len(view):,} risks • page {page} of {pages}")
+    st.dataframe(view.iloc[(page - 1) * page_size: page * page_size].reset_index(drop=True), use_container_width=True)
+
+def render_blocked_impact(df: pd.DataFrame, top: int = RISK_PAGE_SIZE):
+    # which blocked tasks hold up the most downstream work, and which sit on the critical path
+    if df is None or df.empty or DEPENDENCY_COLUMN not in df.columns:
+        st.caption("No dependency column in this dataset (e.g. 'Depends On', 'Blocked By', 'Predecessors').")
+        return
+    deps = get_dependency_analysis(df)
+    impact = deps["blocked_impact"]
+    if impact.empty:
+        st.success("No blocked tasks")
+        return
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Blocked tasks delaying delivery", int(impact["Delays delivery"].sum()))
+    c2.metric("Tasks downstream of a blocker", f"{deps['affected']:,}")
+    c3.metric("Critical path length (days)", f"{deps['project_days']:,.0f}")
+    st.dataframe(impact.head(top), use_container_width=True, hide_index=True)
+    st.caption("Downstream counts every task that transitively depends on the blocker, each task once.")
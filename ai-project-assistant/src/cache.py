@@ -0,0 +1,87 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+# pyarrow is optional: without it the cache is simply disabled
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "cache"
+MAX_CACHE_BYTES = 2 * 1024 ** 3
+# bump when normalize_schema output changes so stale entries are never served
+CACHE_FORMAT = 4
+_BLOCK = 8 * 1024 * 1024
+
+def content_key(source, mode: str = "") -> str:
+    # hashes raw bytes or a file-like object in fixed-size blocks; `mode` separates loaders that
+    # normalize the same bytes differently (whole-file vs chunked)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"v{CACHE_FORMAT}:{mode}:".encode())
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        h.update(source)
+    else:
+        pos = source.tell()
+        source.seek(0)
+        for block in iter(lambda: source.read(_BLOCK), b""):
+            h.update(block if isinstance(block, bytes) else block.encode())
+        source.seek(pos)
+    return h.hexdigest()
+
+def _path(key: str) -> Path:
+    return CACHE_DIR / f"{key}.feather"
+
+def load_cached(key: str) -> Optional[pd.DataFrame]:
+    if feather is None:
+        return None
+    p = _path(key)
+    if not p.exists():
+        return None
+    try:
+        df = feather.read_table(p, memory_map=True).to_pandas()
+    except Exception:
+        p.unlink(missing_ok=True)
+        return None
+    # mtime doubles as the LRU clock
+    os.utime(p)
+    return df
+
+def store_cached(key: str, df: pd.DataFrame, max_bytes: int = MAX_CACHE_BYTES) -> Optional[Path]:
+    if feather is None:
+        return None
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    p = _path(key)
+    tmp = p.with_suffix(".tmp")
+    try:
+        # uncompressed so reads can map the file instead of decoding it
+        feather.write_feather(df.reset_index(drop=True), tmp, compression="uncompressed")
+        os.replace(tmp, p)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        return None
+    evict(max_bytes)
+    return p
+
+def evict(max_bytes: int = MAX_CACHE_BYTES) -> int:
+    # drop least recently used entries until the cache fits the budget
+    if not CACHE_DIR.exists():
+        return 0
+    entries = sorted(((p.stat().st_mtime, p.stat().st_size, p) for p in CACHE_DIR.glob("*.feather")), key=lambda e: e[0])
+    total = sum(e[1] for e in entries)
+    removed = 0
+    for _, size, p in entries:
+        if total <= max_bytes:
+            break
+        p.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+def clear_cache() -> None:
+    if CACHE_DIR.exists():
+        for p in CACHE_DIR.glob("*.feather"):
+            p.unlink(missing_ok=True)
@@ -2,6 +2,7 @@
 import streamlit as st
 from src.llm_client import LLMManager
 from src.kpi import calculate_kpis
+from src.retrieval import retrieve_context
 
 # caching the manager per session
 def _ensure_manager():
@@ -26,6 +27,10 @@ def chatbot_interface():
     for m in st.session_state.chat_history:
         with st.chat_message(m["role"]):
             st.markdown(m["content"])
+    last = st.session_state.get("chat_retrieval")
+    if last:
+        st.caption(f"Context: {last['rows']} of {last['matched']:,} matching tasks • BM25 index built in "
+                   f"{last['build_seconds']:.2f}s • retrieval {last['ms']:.1f} ms")
 
     # input
     user_input = st.chat_input("Ask about status, risks, or recommendations...")
@@ -40,6 +45,11 @@ def chatbot_interface():
                 f"Completed: {kpis['completed']}\nBlocked: {kpis['blocked']}\nOverdue: {kpis['overdue']}\n"
                 f"Velocity: {kpis['velocity']}\n"
             )
+        # rows relevant to the question (BM25 over title, description and epic), kept compact
+        retrieved = retrieve_context(df, user_input)
+        context += retrieved["text"]
+        st.session_state.chat_retrieval = {"rows": len(retrieved["rows"]), "matched": retrieved["matched"],
+                                           "ms": retrieved["ms"], "build_seconds": retrieved["build_seconds"]}
         prompt = f"{context}\nUser question: {user_input}\nAnswer concisely with recommendations and next actions."
 
         if manager:
@@ -50,12 +60,12 @@ def chatbot_interface():
                 ans = f"⚠️ LLM error: {e}"
         else:
             # fallback simulated
-            ans = _simulated_response(user_input, df)
+            ans = _simulated_response(user_input, df, retrieved)
 
         st.session_state.chat_history.append({"role":"assistant","content":ans})
-        st.experimental_rerun()
+        st.rerun()
 
-def _simulated_response(user_input: str, df):
+def _simulated_response(user_input: str, df, retrieved=None):
     # Very simple rule-based fallback (safe)
     text = user_input.lower()
     if "status" in text:
@@ -66,4 +76,8 @@ def _simulated_response(user_input: str, df):
         if df is not None:
             risks = [r for r in []]  # placeholder
         return "I detect some blockers and overdue items — open the Risks tab for details."
+    if retrieved and len(retrieved["rows"]):
+        top = df.iloc[retrieved["rows"][:5]]
+        lines = "\n".join(f"- {r['Task ID']} {r['Task']} ({r['Status']}, {r['Assignee']})" for _, r in top.iterrows())
+        return f"The most relevant tasks for that question:\n{lines}"
     return "I can summarize KPIs, detect risks, and generate recommendations. Try: 'Give me an executive summary'."
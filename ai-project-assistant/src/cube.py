@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from typing import Optional
+from src.data_loader import dataset_version
+
+# only dimensions the dashboard slices by: a time dimension multiplies the cell count for no reader
+CUBE_DIMS = ["Assignee","Epic","Priority","Status"]
+MEASURES = ["tasks","points","overdue"]
+# overdue is judged against "now" floored to this, shared by the cube and the KPI cards so they agree
+OVERDUE_RESOLUTION = "min"
+
+def reference_time() -> pd.Timestamp:
+    return pd.Timestamp.now().floor(OVERDUE_RESOLUTION)
+
+def build_kpi_cube(df: pd.DataFrame, now: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    # one groupby over the row data; every later rollup or slice only touches cube cells
+    now = now or pd.Timestamp.now()
+    if df is None or df.empty:
+        return pd.DataFrame(columns=CUBE_DIMS + MEASURES)
+    status = df["Status"]
+    keys = {
+        "Assignee": df["Assignee"],
+        "Epic": df["Epic"],
+        "Priority": df["Priority"],
+        "Status": status
+    }
+    measures = pd.DataFrame({
+        "tasks": np.ones(len(df), dtype=np.int32),
+        "points": df["Story Points"].to_numpy(dtype=np.int64),
+        "overdue": ((df["Due Date"] < now) & (status != "Done")).to_numpy(dtype=np.int32)
+    }, index=df.index)
+    cube = measures.groupby([keys[d] for d in CUBE_DIMS], observed=True, dropna=False).sum().reset_index()
+    cube.columns = CUBE_DIMS + MEASURES
+    return cube.astype({"tasks": np.int32, "overdue": np.int32})
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_cube(_df: pd.DataFrame, version: str, now: pd.Timestamp) -> pd.DataFrame:
+    return build_kpi_cube(_df, now)
+
+def get_kpi_cube(df: pd.DataFrame) -> pd.DataFrame:
+    # built once per dataset version and reference time, so overdue flags match calculate_kpis
+    return _cached_cube(df, dataset_version(df), reference_time())
+
+def slice_cube(cube: pd.DataFrame, **filters) -> pd.DataFrame:
+    # filters: dim=value or dim=[values]
+    mask = np.ones(len(cube), dtype=bool)
+    for dim, val in filters.items():
+        if val is None or (isinstance(val, (list, set)) and not val):
+            continue
+        mask &= cube[dim].isin(val if isinstance(val, (list, set)) else [val]).to_numpy()
+    return cube[mask]
+
+def cube_kpis(cube: pd.DataFrame, **filters) -> dict:
+    # same shape as calculate_kpis, answered by summing cells
+    cells = slice_cube(cube, **filters)
+    by_status = cells.groupby("Status", observed=True)["tasks"].sum()
+    total = int(cells["tasks"].sum())
+    completed = int(by_status.get("Done", 0))
+    return {
+        "total":total, "completed":completed, "in_progress":int(by_status.get("In Progress", 0)),
+        "blocked":int(by_status.get("Blocked", 0)), "overdue":int(cells["overdue"].sum()),
+        "completion_rate":round((completed / total * 100), 2) if total else 0.0,
+        "velocity":int(cells["points"].sum())
+    }
+
+def cube_rollup(cube: pd.DataFrame, by, **filters) -> pd.DataFrame:
+    # per-group KPI table (e.g. by="Assignee") from the cube cells
+    cells = slice_cube(cube, **filters)
+    by = [by] if isinstance(by, str) else list(by)
+    done = cells["tasks"].where(cells["Status"] == "Done", 0)
+    blocked = cells["tasks"].where(cells["Status"] == "Blocked", 0)
+    out = cells.assign(done=done, blocked=blocked).groupby(by, observed=True)[["tasks","done","blocked","overdue","points"]].sum()
+    out["completion_rate"] = (out["done"] / out["tasks"].where(out["tasks"] > 0) * 100).round(1).fillna(0.0)
+    return out.rename(columns={"tasks":"Tasks","done":"Completed","blocked":"Blocked","overdue":"Overdue",
+                               "points":"Story Points","completion_rate":"Completion %"})
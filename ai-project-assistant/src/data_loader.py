@@ -1,9 +1,18 @@
 # src/data_loader.py
+import hashlib
+import io
+import os
+import uuid
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 import streamlit as st
-from datetime import datetime, timedelta
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from src.cache import content_key, load_cached, store_cached
+from src.schema_match import SchemaMatcher
+from src.synthetic import generate_tasks
 
 # synonyms map (lowercase keys)
 SYNONYMS = {
@@ -26,24 +35,199 @@ SYNONYMS = {
     "due_date": "Due Date",
     "deadline": "Due Date",
     "epic": "Epic",
-    "description": "Description"
+    "description": "Description",
+    "updated": "Updated Date",
+    "updated_at": "Updated Date",
+    "resolved": "Resolved Date",
+    "resolved_at": "Resolved Date",
+    "depends on": "Dependencies",
+    "dependencies": "Dependencies",
+    "blocked by": "Dependencies",
+    "predecessors": "Dependencies"
 }
 
 EXPECTED = ["Task ID","Task","Status","Priority","Assignee","Story Points","Created Date","Due Date","Epic","Description"]
+# optional columns, normalized only when the source has them
+OPTIONAL_DATES = ["Updated Date","Resolved Date"]
+DEPENDENCY_COLUMN = "Dependencies"
 
-def _canon(col: str) -> str:
-    return col.strip().lower().replace("-", " ").replace("_", " ")
+# fixed vocabularies: known values always get the same category codes
+STATUS_VOCAB = ["Todo","In Progress","Review","Blocked","Done"]
+PRIORITY_VOCAB = ["Low","Medium","High","Critical"]
+STATUS_ALIASES = {
+    "to do": "Todo",
+    "open": "Todo",
+    "pending": "Todo",
+    "backlog": "Todo",
+    "in review": "Review",
+    "completed": "Done",
+    "closed": "Done",
+    "resolved": "Done"
+}
+# common tracker priority scales folded into the four levels risk severity is derived from
+PRIORITY_ALIASES = {
+    "lowest": "Low",
+    "trivial": "Low",
+    "minor": "Low",
+    "normal": "Medium",
+    "major": "High",
+    "highest": "Critical",
+    "urgent": "Critical",
+    "blocker": "Critical"
+}
+
+# low-cardinality text columns stored as categoricals
+COMPACT_COLUMNS = ["Status","Priority","Assignee","Epic"]
+CHUNK_ROWS = 100_000
+SUPPORTED_SUFFIXES = (".csv", ".json", ".jsonl", ".ndjson", ".xlsx")
+# folder loads are confined to this directory (override with PROJECT_DATA_ROOT); paths outside it are refused
+DATA_ROOT = Path(os.getenv("PROJECT_DATA_ROOT", Path(__file__).resolve().parent.parent / "data")).resolve()
+
+# candidate formats tried on a sample of each date column, most common exports first
+DATE_FORMATS = [
+    "%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f", "%Y/%m/%d",
+    "%d/%m/%Y", "%m/%d/%Y", "%d/%m/%Y %H:%M", "%m/%d/%Y %H:%M", "%d.%m.%Y",
+    "%d-%b-%Y", "%d %b %Y", "%b %d, %Y", "%B %d, %Y"
+]
+DATE_SAMPLE = 200
+# (source, column, value shape) -> inferred format (None when nothing fits), least recently used first
+_date_formats: OrderedDict = OrderedDict()
+MAX_DATE_FORMATS = 1024
+# rows parsed with the inferred format vs. rows that needed per-element parsing
+DATE_PARSE_STATS = {"fast": 0, "slow": 0, "unparsed": 0}
+
+_schema_matcher = SchemaMatcher(SYNONYMS)
+
+def _vocab_categorical(s: pd.Series, vocab: list, default: str, aliases: Optional[dict] = None) -> pd.Categorical:
+    # canonicalize per unique value, then build the categorical straight from codes
+    lookup = {v.lower(): v for v in vocab}
+    lookup.update(aliases or {})
+    codes, uniques = pd.factorize(s)
+    labels = [lookup.get(str(u).strip().lower(), str(u).strip()) for u in uniques]
+    categories = vocab + sorted(set(labels) - set(vocab))
+    pos = {c: i for i, c in enumerate(categories)}
+    remap = np.array([pos[l] for l in labels] + [pos[default]], dtype=np.int32)
+    # factorize marks missing values as -1, which picks the trailing default slot
+    return pd.Categorical.from_codes(remap[codes], categories=categories)
+
+def _fill(s: pd.Series, value) -> pd.Series:
+    # categorical inputs need the fill value registered as a category first
+    if isinstance(s.dtype, pd.CategoricalDtype) and value not in s.cat.categories:
+        if not s.isna().any():
+            return s
+        s = s.cat.add_categories([value])
+    return s.fillna(value)
+
+def _task_ids(s: pd.Series, id_offset: int = 0) -> np.ndarray:
+    missing = s.isna().to_numpy()
+    if pd.api.types.is_float_dtype(s) and (s[~missing] % 1 == 0).all():
+        # numeric IDs picked up a float dtype from gaps; keep them integral
+        s = s.astype("Int64")
+    ids = s.astype(str).to_numpy(dtype=object)
+    if missing.any():
+        # id_offset keeps generated IDs unique when normalizing chunk by chunk
+        gen = pd.Index(np.flatnonzero(missing) + id_offset + 1).astype(str).str.zfill(5)
+        ids[missing] = ("TASK-" + gen).to_numpy(dtype=object)
+    return ids
+
+def _dependency_lists(s: pd.Series) -> np.ndarray:
+    # "PROJ-1; PROJ-2" / "1 2" / [1, 2] -> "PROJ-1,PROJ-2" / "1,2"; missing -> ""
+    if pd.api.types.is_float_dtype(s) and (s.dropna() % 1 == 0).all():
+        s = s.astype("Int64")
+    first = s.dropna().head(1)
+    if len(first) and isinstance(first.iloc[0], (list, tuple)):
+        s = s.map(lambda v: ",".join(map(str, v)) if isinstance(v, (list, tuple)) else v)
+    out = s.astype(str).where(s.notna(), "")
+    out = out.str.replace(r"[\s;|,]+", ",", regex=True).str.strip(",")
+    return out.to_numpy(dtype=object)
+
+def _infer_date_format(sample: pd.Series) -> Optional[str]:
+    guess = pd.tseries.api.guess_datetime_format(sample.iloc[0])
+    best, best_hits = None, 0
+    for fmt in ([guess] if guess else []) + DATE_FORMATS:
+        hits = int(pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum())
+        if hits > best_hits:
+            best, best_hits = fmt, hits
+            if hits == len(sample):
+                break
+    return best
+
+def parse_dates(s: pd.Series, source: str = "default", column: str = "") -> pd.Series:
+    # vectorized parse with a cached per-source/column format; only leftovers go row by row
+    if pd.api.types.is_datetime64_any_dtype(s) or not (pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s)):
+        return pd.to_datetime(s, errors="coerce")
+    present = s.notna().to_numpy()
+    if not present.any():
+        return pd.to_datetime(s, errors="coerce")
+    values = s[present].astype(str).str.strip()
+    sample = values.iloc[:: max(1, len(values) // DATE_SAMPLE)].iloc[:DATE_SAMPLE]
+    # the value shape ("9999-99-99") keys the cache so a source changing formats is re-inferred
+    shape = sample.str.replace(r"\d", "9", regex=True).str.replace(r"[A-Za-z]+", "a", regex=True).mode().iloc[0]
+    key = (source, column, shape)
+    if key in _date_formats:
+        _date_formats.move_to_end(key)
+    else:
+        _date_formats[key] = _infer_date_format(sample)
+        if len(_date_formats) > MAX_DATE_FORMATS:
+            _date_formats.popitem(last=False)
+    fmt = _date_formats[key]
+
+    # parsed as UTC so aware and naive values share one dtype, then made naive (aware values as UTC wall time)
+    parsed = (pd.to_datetime(values, format=fmt, errors="coerce", utc=True) if fmt
+              else pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns, UTC]"))
+    leftover = parsed.isna().to_numpy()
+    if leftover.any():
+        slow = pd.to_datetime(values[leftover], format="mixed", errors="coerce", utc=True)
+        parsed[leftover] = slow
+        DATE_PARSE_STATS["slow"] += int(leftover.sum())
+        DATE_PARSE_STATS["unparsed"] += int(slow.isna().sum())
+    DATE_PARSE_STATS["fast"] += int((~leftover).sum())
+    parsed = parsed.dt.tz_convert(None).astype("datetime64[ns]")
+    out = pd.Series(pd.NaT, index=s.index, dtype="datetime64[ns]")
+    out[present] = parsed.to_numpy()
+    return out
+
+def stamp_version(df: pd.DataFrame, version: Optional[str] = None) -> pd.DataFrame:
+    # every frame the loader hands out carries a version; derived caches key on it instead of hashing rows
+    df.attrs["dataset_version"] = version or uuid.uuid4().hex
+    df.attrs["dataset_rows"] = len(df)
+    return df
+
+def dataset_version(df: pd.DataFrame) -> str:
+    # attrs survive copies and slices, so the row count guards against filtered views reusing the parent's version
+    v = df.attrs.get("dataset_version")
+    if v is not None and df.attrs.get("dataset_rows") == len(df):
+        return v
+    # unstamped frame: fingerprint shape, columns and an evenly spaced sample of rows
+    pick = np.linspace(0, len(df) - 1, min(len(df), 1024)).astype(np.int64) if len(df) else []
+    h = hashlib.blake2b("|".join(map(str, df.columns)).encode(), digest_size=8)
+    h.update(pd.util.hash_pandas_object(df.iloc[pick], index=True).to_numpy().tobytes())
+    return f"fp-{len(df)}-{h.hexdigest()}"
+
+def _set_invalid_rows(df: pd.DataFrame, masks: dict) -> None:
+    # stored as index labels: slices keep their labels, so each row answers for itself after any iloc/concat
+    df.attrs["invalid_rows"] = {c: df.index[m].tolist() for c, m in masks.items()}
+
+def invalid_masks(df: pd.DataFrame) -> dict:
+    # column -> boolean mask of this frame's rows whose source value failed to parse
+    return {c: df.index.isin(rows) for c, rows in (df.attrs.get("invalid_rows") or {}).items()}
 
-def normalize_schema(df: pd.DataFrame) -> pd.DataFrame:
+def invalid_counts(df: pd.DataFrame) -> dict:
+    return {c: int(m.sum()) for c, m in invalid_masks(df).items()}
+
+def normalize_schema(df: pd.DataFrame, id_offset: int = 0, source: str = "default") -> pd.DataFrame:
+    mapping = _schema_matcher.match(df.columns)
     rename = {}
     for c in df.columns:
-        k = _canon(c)
-        if k in SYNONYMS:
-            rename[c] = SYNONYMS[k]
+        target = mapping[str(c)]["target"]
+        if target:
+            rename[c] = target
         else:
             # best-effort title case
-            rename[c] = " ".join(w.capitalize() for w in c.replace("_"," ").split())
+            rename[c] = " ".join(w.capitalize() for w in str(c).replace("_"," ").split())
     df = df.rename(columns=rename)
+    # kept on the frame so the sidebar can show how headers were interpreted
+    df.attrs["schema_mapping"] = mapping
 
     # ensure expected columns
     for c in EXPECTED:
@@ -51,54 +235,211 @@ def normalize_schema(df: pd.DataFrame) -> pd.DataFrame:
             df[c] = np.nan
 
     # types & defaults
-    df["Task ID"] = df["Task ID"].fillna([f"TASK-{i+1:05d}" for i in range(len(df))])
-    df["Task"] = df["Task"].fillna("Untitled Task")
-    df["Status"] = df["Status"].fillna("Todo")
-    df["Priority"] = df["Priority"].fillna("Medium")
+    df["Task ID"] = _task_ids(df["Task ID"], id_offset)
+    df["Task"] = _fill(df["Task"], "Untitled Task")
+    df["Status"] = _vocab_categorical(df["Status"], STATUS_VOCAB, "Todo", STATUS_ALIASES)
+    df["Priority"] = _vocab_categorical(df["Priority"], PRIORITY_VOCAB, "Medium", PRIORITY_ALIASES)
+    df["Assignee"] = df["Assignee"].astype("category")
+    # rows whose source value was present but not coercible; the quality profiler reports them as invalid
+    invalid = {}
     # Story Points numeric
-    df["Story Points"] = pd.to_numeric(df["Story Points"], errors="coerce").fillna(0).astype(int)
+    points = pd.to_numeric(df["Story Points"], errors="coerce")
+    invalid["Story Points"] = (points.isna() & df["Story Points"].notna()).to_numpy()
+    df["Story Points"] = points.fillna(0).astype(np.int32)
     # Dates
     for d in ["Created Date","Due Date"]:
-        df[d] = pd.to_datetime(df[d], errors="coerce")
-    df["Epic"] = df["Epic"].fillna("General")
-    df["Description"] = df["Description"].fillna("")
+        raw_present = df[d].notna()
+        df[d] = parse_dates(df[d], source, d)
+        invalid[d] = (raw_present & df[d].isna()).to_numpy()
+    for d in OPTIONAL_DATES:
+        if d in df.columns:
+            df[d] = parse_dates(df[d], source, d)
+    if DEPENDENCY_COLUMN in df.columns:
+        df[DEPENDENCY_COLUMN] = _dependency_lists(df[DEPENDENCY_COLUMN])
+    df["Epic"] = _fill(df["Epic"], "General").astype("category")
+    df["Description"] = _fill(df["Description"], "")
 
     # reorder
     cols = EXPECTED + [c for c in df.columns if c not in EXPECTED]
     df = df.loc[:, cols]
-    return df
+    _set_invalid_rows(df, invalid)
+    return stamp_version(df)
+
+def _read_frame(uploaded_file) -> pd.DataFrame:
+    name = getattr(uploaded_file, "name", "uploaded").lower()
+    if name.endswith(".csv"):
+        return pd.read_csv(uploaded_file)
+    if name.endswith((".jsonl", ".ndjson")):
+        return pd.read_json(uploaded_file, lines=True)
+    if name.endswith(".json"):
+        return pd.read_json(uploaded_file)
+    return pd.read_excel(uploaded_file)
+
+def _load_normalized(uploaded_file) -> pd.DataFrame:
+    # normalized results are reused across processes via the on-disk cache
+    key = content_key(uploaded_file, "full")
+    df = load_cached(key)
+    if df is None:
+        df = normalize_schema(_read_frame(uploaded_file), source=getattr(uploaded_file, "name", "default"))
+        store_cached(key, df)
+    # same bytes -> same version, across reruns and restarts
+    return stamp_version(df, key)
 
 @st.cache_data
 def load_and_process_data(uploaded_file) -> pd.DataFrame:
     # accept file-like
-    name = getattr(uploaded_file, "name", "uploaded")
-    if name.lower().endswith(".csv"):
-        df = pd.read_csv(uploaded_file)
-    elif name.lower().endswith(".json"):
-        df = pd.read_json(uploaded_file)
+    return _load_normalized(uploaded_file)
+
+def _parse_source(source) -> pd.DataFrame:
+    # process-pool worker: source is a path or a (name, raw bytes) pair
+    if isinstance(source, tuple):
+        name, raw = source
+        buf = io.BytesIO(raw)
+        buf.name = name
+        return _load_normalized(buf)
+    with open(source, "rb") as f:
+        return _load_normalized(f)
+
+def list_data_files(directory, root: Path = DATA_ROOT) -> list:
+    # directory is taken relative to root; anything resolving outside it (.., absolute paths, symlinks) is refused
+    root = Path(root).resolve()
+    base = (root / directory).resolve()
+    if not base.is_relative_to(root):
+        raise ValueError(f"Folder must be inside {root}")
+    return sorted(p for p in base.rglob("*") if p.is_file() and p.suffix.lower() in SUPPORTED_SUFFIXES
+                  and p.resolve().is_relative_to(root))
+
+def load_many(sources: list, max_workers: Optional[int] = None) -> pd.DataFrame:
+    # sources: paths and/or (name, bytes) pairs; files are parsed in parallel, one per worker
+    names = [Path(s[0] if isinstance(s, tuple) else s).name for s in sources]
+    workers = min(len(sources), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        frames = [_parse_source(s) for s in sources]
     else:
-        df = pd.read_excel(uploaded_file)
-    df = normalize_schema(df)
-    return df
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(_parse_source, sources))
+    for name, f in zip(names, frames):
+        f["Source"] = pd.Categorical.from_codes(np.zeros(len(f), dtype=np.int8), categories=[name])
+    return concat_compact(frames)
+
+def iter_raw_chunks(uploaded_file, chunksize: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    # bounded readers only: whole-document JSON and Excel cannot be streamed
+    name = getattr(uploaded_file, "name", "uploaded").lower()
+    if name.endswith(".csv"):
+        return pd.read_csv(uploaded_file, chunksize=chunksize)
+    if name.endswith((".jsonl", ".ndjson")):
+        return pd.read_json(uploaded_file, lines=True, chunksize=chunksize)
+    raise ValueError("Streaming ingestion supports CSV and JSONL files only")
 
-def generate_sample_data(n_tasks: int = 100) -> pd.DataFrame:
-    import numpy as np
-    base = datetime.now() - timedelta(days=60)
-    np.random.seed(42)
-    statuses = ["Todo","In Progress","Done","Blocked","Review"]
-    priorities = ["Low","Medium","High","Critical"]
-    assignees = ["Alice Johnson","Bob Smith","Charlie Brown","Diana Prince","Eve Wilson","Frank Miller"]
-    data = {
-        "Task ID":[f"PROJ-{i+1:03d}" for i in range(n_tasks)],
-        "Task":[f"Implement feature {chr(65+i%26)}" for i in range(n_tasks)],
-        "Status":np.random.choice(statuses, n_tasks, p=[0.15,0.35,0.35,0.08,0.07]),
-        "Priority":np.random.choice(priorities, n_tasks, p=[0.3,0.4,0.25,0.05]),
-        "Assignee":np.random.choice(assignees, n_tasks),
-        "Story Points":np.random.choice([1,2,3,5,8,13], n_tasks, p=[0.15,0.3,0.25,0.2,0.08,0.02]),
-        "Created Date":[base + timedelta(days=np.random.randint(0,50)) for _ in range(n_tasks)],
-        "Due Date":[base + timedelta(days=60 + np.random.randint(0,30)) for _ in range(n_tasks)],
-        "Epic":np.random.choice(["User Management","Payment System","Analytics","Mobile App","API"], n_tasks),
-        "Description":["Auto-generated sample task" for _ in range(n_tasks)]
+def _file_size(uploaded_file) -> int:
+    size = getattr(uploaded_file, "size", None)
+    if size is None and hasattr(uploaded_file, "seek"):
+        pos = uploaded_file.tell()
+        size = uploaded_file.seek(0, 2)
+        uploaded_file.seek(pos)
+    return size or 0
+
+def concat_compact(frames: list) -> pd.DataFrame:
+    # union categories first so concat keeps the categorical dtype instead of falling back to object
+    if not frames:
+        return normalize_schema(pd.DataFrame(columns=EXPECTED))
+    if len(frames) == 1:
+        return frames[0]
+    cats = {}
+    for c in frames[0].columns:
+        if all(c in f.columns and isinstance(f[c].dtype, pd.CategoricalDtype) for f in frames):
+            cats[c] = pd.Index(np.concatenate([f[c].cat.categories.astype(object) for f in frames])).unique()
+    # concat drops attrs that differ between frames: stack per-row invalid masks, keep the first mapping per header
+    masks = [invalid_masks(f) for f in frames]
+    invalid = {c: np.concatenate([m.get(c, np.zeros(len(f), dtype=bool)) for f, m in zip(frames, masks)])
+               for c in dict.fromkeys(c for m in masks for c in m)}
+    mapping = {}
+    for f in frames:
+        for h, m in (f.attrs.get("schema_mapping") or {}).items():
+            mapping.setdefault(h, m)
+    frames = [f.astype({c: pd.CategoricalDtype(v) for c, v in cats.items()}) for f in frames]
+    out = pd.concat(frames, ignore_index=True)
+    out.attrs["schema_mapping"] = mapping
+    _set_invalid_rows(out, invalid)
+    return stamp_version(out)
+
+def load_streaming(uploaded_file, chunksize: int = CHUNK_ROWS,
+                   progress: Optional[Callable[[int, float], None]] = None) -> pd.DataFrame:
+    # peak memory ~ one raw chunk + the compact normalized result
+    key = content_key(uploaded_file, "stream")
+    cached = load_cached(key)
+    if cached is not None:
+        if progress:
+            progress(len(cached), 1.0)
+        return stamp_version(cached, key)
+    size = _file_size(uploaded_file)
+    frames = []
+    rows = 0
+    for raw in iter_raw_chunks(uploaded_file, chunksize):
+        frames.append(normalize_schema(raw, id_offset=rows, source=getattr(uploaded_file, "name", "default")))
+        rows += len(raw)
+        del raw
+        if progress:
+            done = uploaded_file.tell() / size if size and hasattr(uploaded_file, "tell") else 0.0
+            progress(rows, min(done, 1.0))
+    df = concat_compact(frames)
+    store_cached(key, df)
+    if progress:
+        progress(rows, 1.0)
+    return stamp_version(df, key)
+
+def _row_hashes(df: pd.DataFrame, cols: list) -> np.ndarray:
+    # value-based hashes (categoricals hash by label, not code) for cheap row comparison
+    return pd.util.hash_pandas_object(df[cols], index=False).to_numpy()
+
+def upsert_tasks(current: pd.DataFrame, incoming: pd.DataFrame, full_snapshot: bool = True):
+    # diff an upload against the current data by Task ID; returns (merged, changes)
+    # full_snapshot=True treats IDs missing from the upload as deletions
+    incoming = incoming.drop_duplicates("Task ID", keep="last")
+    cur_ids = pd.Index(current["Task ID"])
+    new_ids = pd.Index(incoming["Task ID"])
+    pos_in_new = new_ids.get_indexer(cur_ids)
+    common = pos_in_new >= 0
+
+    cols = [c for c in current.columns if c in incoming.columns and c != "Task ID"]
+    changed = np.zeros(len(current), dtype=bool)
+    if common.any():
+        changed[common] = _row_hashes(current.iloc[np.flatnonzero(common)], cols) != _row_hashes(incoming.iloc[pos_in_new[common]], cols)
+    deleted = ~common if full_snapshot else np.zeros(len(current), dtype=bool)
+    inserted = ~new_ids.isin(cur_ids)
+
+    changes = {
+        "inserted": new_ids[inserted],
+        "updated": cur_ids[changed],
+        "deleted": cur_ids[deleted]
     }
-    df = pd.DataFrame(data)
+    if not (changed.any() or deleted.any() or inserted.any()):
+        return current, changes
+
+    # rows keep their current position; updated rows take the incoming values, inserts go last
+    keep = ~(changed | deleted)
+    parts = [current.iloc[np.flatnonzero(keep)], incoming.iloc[pos_in_new[changed]], incoming.iloc[np.flatnonzero(inserted)]]
+    order = np.concatenate([np.flatnonzero(keep), np.flatnonzero(changed), len(current) + np.arange(inserted.sum())])
+    merged = concat_compact([p for p in parts if len(p)] or parts[:1])
+    merged = merged.iloc[np.argsort(order[:len(merged)], kind="stable")]
+    invalid = invalid_masks(merged)
+    merged = merged.reset_index(drop=True)
+    _set_invalid_rows(merged, invalid)
+    return stamp_version(merged), changes
+
+SAMPLE_ASSIGNEES = ["Alice Johnson","Bob Smith","Charlie Brown","Diana Prince","Eve Wilson","Frank Miller"]
+SAMPLE_EPICS = ["User Management","Payment System","Analytics","Mobile App","API"]
+
+def generate_sample_data(n_tasks: int = 100, seed: int = 42, now: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    # demo-sized data keeps the familiar team; larger runs use the synthetic generator's skewed pools.
+    # Dates are reproducible unless `now` is given, in which case the span ends there
+    small = n_tasks <= 1000
+    span_days = 90 if small else 365
+    df = generate_tasks(
+        n_tasks, seed=seed,
+        assignees=SAMPLE_ASSIGNEES if small else None,
+        epics=SAMPLE_EPICS if small else None,
+        base=None if now is None else (pd.Timestamp(now) - pd.Timedelta(days=span_days)).to_pydatetime(),
+        span_days=span_days
+    )
     return normalize_schema(df)
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from src.data_loader import dataset_version
+
+NUM_PERM = 64
+BANDS = 16
+# estimated Jaccard similarity (share of agreeing MinHash slots) a candidate pair must reach
+SIMILARITY = 0.7
+_SEED = 1234
+
+def _texts(df: pd.DataFrame) -> pd.Series:
+    text = df["Task"].astype(str)
+    if "Description" in df.columns:
+        text = text + " " + df["Description"].astype(str)
+    return text.str.lower().str.replace(r"\s+", " ", regex=True).str.strip()
+
+def minhash_signatures(texts, num_perm: int = NUM_PERM, seed: int = _SEED) -> np.ndarray:
+    # byte-trigram shingles for every text in one flat array, then a segment-wise min per hash function
+    # (texts are padded to three bytes so each has at least one shingle)
+    encoded = [t.encode("utf-8").ljust(3, b"\0") for t in texts]
+    sig = np.empty((len(encoded), num_perm), dtype=np.uint32)
+    if not len(encoded):
+        return sig
+    lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+    buf = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint32)
+    owner = np.repeat(np.arange(len(encoded)), lengths)
+    # a shingle starting at i is valid when i+2 belongs to the same text
+    valid = np.flatnonzero(owner[:-2] == owner[2:])
+    shingles = (buf[valid] << 16) | (buf[valid + 1] << 8) | buf[valid + 2]
+    bounds = np.r_[0, np.cumsum(lengths - 2)[:-1]]
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 32, num_perm, dtype=np.uint64).astype(np.uint32) | np.uint32(1)
+    b = rng.integers(0, 1 << 32, num_perm, dtype=np.uint64).astype(np.uint32)
+    with np.errstate(over="ignore"):
+        for k in range(num_perm):
+            # odd-multiplier hash mod 2^32 with an xor-shift to mix the high bits down; no division needed
+            h = a[k] * shingles + b[k]
+            h ^= h >> 15
+            sig[:, k] = np.minimum.reduceat(h, bounds)
+    return sig
+
+def _components(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    # connected components by min-label propagation with pointer jumping
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[u], labels[v])
+        before = labels.copy()
+        np.minimum.at(labels, u, low)
+        np.minimum.at(labels, v, low)
+        labels = labels[labels]
+        if np.array_equal(labels, before):
+            return labels
+
+def lsh_pairs(sig: np.ndarray, bands: int = BANDS, threshold: float = SIMILARITY):
+    # texts sharing any band bucket become candidates; each bucket links members to its first entry
+    # (a star, not all pairs), then candidates are verified on the full signature
+    n, k = sig.shape
+    rows = k // bands
+    weights = np.random.default_rng(_SEED).integers(1, 1 << 63, rows, dtype=np.uint64) | np.uint64(1)
+    us, vs = [], []
+    with np.errstate(over="ignore"):
+        for band in range(bands):
+            # one uint64 bucket key per text; rare key collisions are removed by the verification below
+            key = (sig[:, band * rows:(band + 1) * rows].astype(np.uint64) * weights).sum(axis=1)
+            order = np.argsort(key, kind="stable")
+            sorted_key = key[order]
+            head = np.r_[True, sorted_key[1:] != sorted_key[:-1]]
+            leader = order[np.flatnonzero(head)[np.cumsum(head) - 1]]
+            keep = leader != order
+            us.append(leader[keep])
+            vs.append(order[keep])
+    u, v = np.concatenate(us), np.concatenate(vs)
+    pair = np.sort(np.minimum(u, v) * n + np.maximum(u, v))
+    pair = pair[np.r_[True, pair[1:] != pair[:-1]]] if len(pair) else pair
+    u, v = pair // n, pair % n
+    sim = (sig[u] == sig[v]).mean(axis=1) if len(pair) else np.empty(0)
+    ok = sim >= threshold
+    return u[ok], v[ok], sim[ok]
+
+def find_duplicates(df: pd.DataFrame, threshold: float = SIMILARITY) -> pd.DataFrame:
+    # one row per task in a duplicate cluster, indexed by row position; the earliest created task
+    # of each cluster is kept as canonical
+    cols = ["Task ID","Task","Cluster","Size","Similarity","Canonical"]
+    if df is None or df.empty:
+        return pd.DataFrame(columns=cols)
+    # identical (Task, Description) pairs are hashed once and are duplicates of each other by definition
+    codes = pd.factorize(df["Task"])[0].astype(np.int64)
+    if "Description" in df.columns:
+        desc = pd.factorize(df["Description"])[0]
+        codes = codes * (int(desc.max()) + 2) + desc
+    codes, uniques = pd.factorize(codes)
+    firsts = np.full(len(uniques), len(df), dtype=np.int64)
+    np.minimum.at(firsts, codes, np.arange(len(df)))
+    sig = minhash_signatures(_texts(df.iloc[firsts]).tolist())
+    u, v, _ = lsh_pairs(sig, threshold=threshold)
+    cluster = _components(len(uniques), u, v)[codes]
+    size = np.bincount(cluster, minlength=len(uniques))[cluster]
+    rows = np.flatnonzero(size > 1)
+    if not len(rows):
+        return pd.DataFrame(columns=cols)
+    created = df["Created Date"].to_numpy()[rows]
+    order = rows[np.lexsort((rows, created, cluster[rows]))]
+    first = np.r_[True, cluster[order][1:] != cluster[order][:-1]]
+    canonical_row = order[np.flatnonzero(first)[np.cumsum(first) - 1]]
+    sim = (sig[codes[order]] == sig[codes[canonical_row]]).mean(axis=1)
+    out = pd.DataFrame({
+        "Task ID": df["Task ID"].to_numpy()[order], "Task": df["Task"].to_numpy()[order],
+        "Cluster": pd.factorize(cluster[order])[0], "Size": size[order],
+        "Similarity": sim.round(2), "Canonical": first
+    }, index=order)
+    return out
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _cached_duplicates(_df: pd.DataFrame, version: str, threshold: float) -> pd.DataFrame:
+    return find_duplicates(_df, threshold)
+
+def get_duplicates(df: pd.DataFrame, threshold: float = SIMILARITY) -> pd.DataFrame:
+    return _cached_duplicates(df, dataset_version(df), threshold)
+
+def duplicate_mask(df: pd.DataFrame, threshold: float = SIMILARITY) -> np.ndarray:
+    # True for rows that duplicate an earlier canonical task
+    mask = np.zeros(len(df), dtype=bool)
+    dups = get_duplicates(df, threshold)
+    mask[dups.index[~dups["Canonical"].to_numpy(dtype=bool)]] = True
+    return mask
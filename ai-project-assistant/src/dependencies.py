@@ -0,0 +1,327 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from src.data_loader import DEPENDENCY_COLUMN, dataset_version
+
+def _gather(indptr: np.ndarray, indices: np.ndarray, nodes: np.ndarray):
+    # CSR rows of `nodes` flattened: (owning node for each entry, neighbour) without a Python loop
+    starts, counts = indptr[nodes], indptr[nodes + 1] - indptr[nodes]
+    total = int(counts.sum())
+    if not total:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=indices.dtype)
+    owner = np.repeat(nodes, counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, indices[np.repeat(starts, counts) + offsets]
+
+def _csr(src: np.ndarray, dst: np.ndarray, n: int):
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return indptr, dst[order].astype(np.int32)
+
+def _components(nodes: list, ptr: list, adj: list) -> dict:
+    # iterative Tarjan over `nodes`, whose successors must all be in `nodes`: node -> component number
+    index, low, comp, on_stack, stack, count = {}, {}, {}, set(), [], 0
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, i = work[-1]
+            if not i:
+                index[v] = low[v] = len(index)
+                stack.append(v)
+                on_stack.add(v)
+            if ptr[v] + i < ptr[v + 1]:
+                work[-1] = (v, i + 1)
+                w = adj[ptr[v] + i]
+                if w not in index:
+                    work.append((w, 0))
+                elif w in on_stack:
+                    low[v] = min(low[v], index[w])
+                continue
+            work.pop()
+            if work:
+                u = work[-1][0]
+                low[u] = min(low[u], low[v])
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack.discard(w)
+                    comp[w] = count
+                    if w == v:
+                        break
+                count += 1
+    return comp
+
+# frontiers at least this wide are processed in one array step; narrower ones (long chains) node by
+# node, where per-call numpy overhead would otherwise dominate
+WIDE_FRONTIER = 64
+# memory budget for reachability bitsets; blocked tasks are processed in batches that fit it
+BITSET_BYTES = 64 * 1024 ** 2
+
+class TaskGraph:
+    # nodes are row positions; an edge p -> t means task t depends on task p
+    def __init__(self, df: pd.DataFrame):
+        n = len(df)
+        ids = df["Task ID"].astype(str).to_numpy()
+        codes, uniques = pd.factorize(ids)
+        # duplicate IDs resolve to their first row
+        first = np.full(len(uniques), n, dtype=np.int64)
+        np.minimum.at(first, codes, np.arange(n))
+        src = dst = np.empty(0, dtype=np.int64)
+        if DEPENDENCY_COLUMN in df.columns:
+            deps = df[DEPENDENCY_COLUMN].astype(str).to_numpy()
+            rows = np.flatnonzero(deps != "")
+            if len(rows):
+                exploded = pd.Series(deps[rows], index=rows).str.split(",").explode()
+                pos = pd.Index(uniques).get_indexer(exploded.to_numpy())
+                known = pos >= 0
+                src, dst = first[pos[known]], exploded.index.to_numpy()[known]
+                keep = src != dst
+                edges = np.unique(np.stack([src[keep], dst[keep]]).astype(np.int64), axis=1)
+                src, dst = edges[0], edges[1]
+        self._build(src, dst, n)
+
+    @classmethod
+    def from_edges(cls, src: np.ndarray, dst: np.ndarray, n: int) -> "TaskGraph":
+        graph = cls.__new__(cls)
+        graph._build(src, dst, n)
+        return graph
+
+    def _build(self, src: np.ndarray, dst: np.ndarray, n: int):
+        self.n, self.edges = n, len(src)
+        self.indptr, self.indices = _csr(src, dst, n)
+        self.rindptr, self.rindices = _csr(dst, src, n)
+        self._lists = None
+        self._condensed = None
+        self._levels()
+        self.segments = self._segments()
+
+    @property
+    def levels(self) -> int:
+        return len(self.level_ptr) - 1
+
+    def _adjacency(self):
+        # plain lists for the node-by-node path; indexing them is far cheaper than indexing arrays
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist())
+        return self._lists
+
+    def _levels(self):
+        # frontier Kahn: peel every zero in-degree node at once. Fills the topological order and
+        # level_ptr, the offsets of each level within it
+        indeg = np.diff(self.rindptr)
+        frontier = np.flatnonzero(indeg == 0)
+        order, bounds, done = np.empty(self.n, dtype=np.int64), [0], 0
+        while len(frontier):
+            order[done:done + len(frontier)] = frontier
+            done += len(frontier)
+            bounds.append(done)
+            if len(frontier) >= WIDE_FRONTIER:
+                _, succ = _gather(self.indptr, self.indices, frontier)
+                touched, hits = np.unique(succ, return_counts=True)
+                indeg[touched] -= hits
+                frontier = touched[indeg[touched] == 0]
+            else:
+                ptr, adj = self._adjacency()
+                nxt = []
+                for v in frontier.tolist():
+                    for t in adj[ptr[v]:ptr[v + 1]]:
+                        indeg[t] -= 1
+                        if not indeg[t]:
+                            nxt.append(t)
+                frontier = np.array(nxt, dtype=np.int64)
+        self.order, self.level_ptr = order[:done], np.array(bounds, dtype=np.int64)
+
+    def _segments(self) -> list:
+        # (nodes, wide) slices of the topological order: each wide level on its own, runs of
+        # consecutive narrow levels merged and walked node by node
+        wide = np.diff(self.level_ptr) >= WIDE_FRONTIER
+        starts = np.flatnonzero(wide | np.r_[True, wide[:-1]])
+        bounds = np.r_[self.level_ptr[starts], len(self.order)]
+        return [(self.order[lo:hi], bool(w)) for lo, hi, w in zip(bounds[:-1], bounds[1:], wide[starts])]
+
+    def topological_order(self) -> np.ndarray:
+        return self.order
+
+    def cyclic(self) -> np.ndarray:
+        # rows Kahn never released: on a cycle or downstream of one
+        mask = np.ones(self.n, dtype=bool)
+        mask[self.order] = False
+        return mask
+
+    def schedule(self, duration: np.ndarray) -> pd.DataFrame:
+        # CPM forward/backward pass over the topological order; slack 0 marks the critical path
+        d = np.asarray(duration, dtype=np.float64)
+        es = np.zeros(self.n)
+        ef = np.full(self.n, np.nan)
+        for nodes, wide in self.segments:
+            if wide:
+                ef[nodes] = es[nodes] + d[nodes]
+                owner, succ = _gather(self.indptr, self.indices, nodes)
+                np.maximum.at(es, succ, ef[owner])
+                continue
+            ptr, adj = self._adjacency()
+            for v in nodes.tolist():
+                f = ef[v] = es[v] + d[v]
+                for t in adj[ptr[v]:ptr[v + 1]]:
+                    if es[t] < f:
+                        es[t] = f
+        end = np.nanmax(ef) if len(self.order) else 0.0
+        lf = np.full(self.n, end)
+        ls = np.full(self.n, np.nan)
+        for nodes, wide in reversed(self.segments):
+            if wide:
+                owner, succ = _gather(self.indptr, self.indices, nodes)
+                np.fmin.at(lf, owner, ls[succ])
+                ls[nodes] = lf[nodes] - d[nodes]
+                continue
+            ptr, adj = self._adjacency()
+            for v in reversed(nodes.tolist()):
+                # successors in or behind a cycle have no LS and are skipped, as fmin does
+                f = min((ls[t] for t in adj[ptr[v]:ptr[v + 1]] if ls[t] < lf[v]), default=lf[v])
+                lf[v], ls[v] = f, f - d[v]
+        slack = ls - es
+        depth = np.full(self.n, -1, dtype=np.int32)
+        depth[self.order] = np.repeat(np.arange(self.levels, dtype=np.int32), np.diff(self.level_ptr))
+        return pd.DataFrame({"Level": depth, "ES": es, "EF": ef, "LS": ls, "LF": lf,
+                             "Slack": slack, "Critical": np.isclose(slack, 0)})
+
+    def _push(self, reach: np.ndarray) -> np.ndarray:
+        # reach[t] |= reach[p] along every edge p -> t in topological order; rows may be bitset words.
+        # Nodes in or behind a cycle receive bits but do not pass them on
+        for nodes, wide in self.segments:
+            if wide:
+                if reach.ndim == 1:
+                    # a level has no edges inside it, so its flags are final: only reached nodes pass on
+                    nodes = nodes[reach[nodes]]
+                owner, succ = _gather(self.indptr, self.indices, nodes)
+                np.bitwise_or.at(reach, succ, reach[owner])
+                continue
+            ptr, adj = self._adjacency()
+            for v in nodes.tolist():
+                r = reach[v]
+                for t in adj[ptr[v]:ptr[v + 1]]:
+                    reach[t] |= r
+        return reach
+
+    def condensed(self):
+        # each cycle collapsed into one node: (component per row, rows per component, acyclic graph of
+        # the components). Rows Kahn released are their own components; only the rest go through Tarjan
+        if self._condensed is None:
+            cyclic = np.flatnonzero(self.cyclic())
+            if not len(cyclic):
+                self._condensed = (np.arange(self.n), np.ones(self.n, dtype=np.int64), self)
+            else:
+                # successors of unreleased rows are unreleased too, so the cyclic part is closed
+                comp = np.empty(self.n, dtype=np.int64)
+                comp[self.order] = np.arange(len(self.order))
+                labels = _components(cyclic.tolist(), *self._adjacency())
+                comp[cyclic] = len(self.order) + np.array([labels[v] for v in cyclic.tolist()], dtype=np.int64)
+                k = int(comp.max()) + 1
+                src = comp[np.repeat(np.arange(self.n), np.diff(self.indptr))]
+                dst = comp[self.indices]
+                edges = np.unique(np.stack([src[src != dst], dst[src != dst]]), axis=1)
+                self._condensed = (comp, np.bincount(comp, minlength=k), TaskGraph.from_edges(edges[0], edges[1], k))
+        return self._condensed
+
+    def _reached(self, sources: np.ndarray) -> np.ndarray:
+        # components strictly downstream of the sources' components; a cycle reaches its own members
+        comp, size, graph = self.condensed()
+        cs = comp[sources]
+        seen = np.zeros(graph.n, dtype=bool)
+        seen[_gather(graph.indptr, graph.indices, cs)[1]] = True
+        seen[cs[size[cs] > 1]] = True
+        return graph._push(seen)
+
+    def descendants(self, sources: np.ndarray) -> np.ndarray:
+        # everything downstream of `sources` (a source only if another one, or its own cycle, reaches it)
+        sources = np.asarray(sources, dtype=np.int64)
+        return self._reached(sources)[self.condensed()[0]]
+
+    def downstream(self, sources: np.ndarray, critical: np.ndarray):
+        # exact descendant count per source, whether the source or any descendant is critical, and the
+        # union of descendants. Works on the condensed graph so cycles are counted once per member. Each
+        # source owns one bit; bitsets are pushed through the components below the sources, in batches
+        # of sources that fit BITSET_BYTES
+        sources = np.asarray(sources, dtype=np.int64)
+        comp, size, graph = self.condensed()
+        reached = self._reached(sources)
+        affected = reached[comp]
+        count, hits = np.zeros(len(sources), dtype=np.int64), critical[sources].copy()
+        cs = comp[sources]
+        # sources with no successors and outside any cycle have nothing downstream
+        active = np.flatnonzero((graph.indptr[cs + 1] > graph.indptr[cs]) | (size[cs] > 1))
+        if not len(active):
+            return count, hits, affected
+        keep = reached.copy()
+        keep[cs[active]] = True
+        sub = np.flatnonzero(keep)
+        local = np.full(graph.n, -1, dtype=np.int64)
+        local[sub] = np.arange(len(sub))
+        owner, succ = _gather(graph.indptr, graph.indices, sub)
+        # everything below a kept component is reached, so no edge leaves the subgraph
+        subgraph = TaskGraph.from_edges(local[owner], local[succ], len(sub))
+        weight = size[sub]
+        crit_comp = np.zeros(graph.n, dtype=bool)
+        crit_comp[comp[critical]] = True
+        crit = np.flatnonzero(crit_comp[sub])
+        words = int(min(max(BITSET_BYTES // (8 * len(sub)), 1), -(-len(active) // 64)))
+        for lo in range(0, len(active), words * 64):
+            batch = active[lo:lo + words * 64]
+            bit = np.arange(len(batch))
+            bits = np.zeros((len(sub), words), dtype=np.uint64)
+            np.bitwise_or.at(bits, (local[cs[batch]], bit // 64), np.left_shift(np.uint64(1), (bit % 64).astype(np.uint64)))
+            subgraph._push(bits)
+            # little-endian bytes unpacked little-endian give bit b of word w at column 64 * w + b;
+            # each component counts as many rows as it holds
+            width = max(BITSET_BYTES // (64 * words), 1)
+            total = np.zeros(64 * words, dtype=np.int64)
+            for r in range(0, len(sub), width):
+                unpacked = np.unpackbits(bits[r:r + width].astype("<u8").view(np.uint8), axis=1, bitorder="little")
+                total += unpacked.sum(axis=0, dtype=np.int64)
+                extra = np.flatnonzero(weight[r:r + width] > 1)
+                if len(extra):
+                    total += (weight[r + extra] - 1) @ unpacked[extra].astype(np.int64)
+            count[batch] = total[bit] - 1
+            if len(crit):
+                reached_bits = np.bitwise_or.reduce(bits[crit], axis=0)
+                hits[batch] |= np.unpackbits(reached_bits.astype("<u8").view(np.uint8), bitorder="little")[bit].astype(bool)
+        return count, hits, affected
+
+def task_durations(df: pd.DataFrame) -> np.ndarray:
+    # planned days from Created to Due; undated tasks fall back to one day per story point
+    days = (df["Due Date"] - df["Created Date"]).dt.days.to_numpy(dtype=np.float64)
+    points = df["Story Points"].to_numpy(dtype=np.float64)
+    return np.clip(np.where(np.isnan(days), points, days), 0, None)
+
+def analyze_dependencies(df: pd.DataFrame) -> dict:
+    graph = TaskGraph(df)
+    sched = graph.schedule(task_durations(df))
+    critical = sched["Critical"].to_numpy() & (graph.edges > 0)
+    blocked = np.flatnonzero((df["Status"] == "Blocked").to_numpy())
+    count, hits, affected = graph.downstream(blocked, critical)
+    impact = pd.DataFrame({
+        "Task ID": df["Task ID"].to_numpy()[blocked],
+        "Task": df["Task"].to_numpy()[blocked],
+        "Assignee": df["Assignee"].to_numpy()[blocked],
+        "Downstream": count,
+        "Slack (days)": sched["Slack"].to_numpy()[blocked].round(1),
+        "Delays delivery": hits
+    }).sort_values(["Delays delivery","Downstream"], ascending=False, ignore_index=True)
+    sched.insert(0, "Task ID", df["Task ID"].to_numpy())
+    return {
+        "edges": graph.edges, "levels": graph.levels, "cyclic": int(graph.cyclic().sum()),
+        "schedule": sched, "blocked_impact": impact, "affected": int(affected.sum()),
+        "critical_path": sched.loc[critical].sort_values("ES")["Task ID"].tolist(),
+        "project_days": float(np.nanmax(sched["EF"])) if len(sched) and sched["EF"].notna().any() else 0.0
+    }
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _cached_analysis(_df: pd.DataFrame, version: str) -> dict:
+    return analyze_dependencies(_df)
+
+def get_dependency_analysis(df: pd.DataFrame) -> dict:
+    # graph + schedule built once per dataset version
+    return _cached_analysis(df, dataset_version(df))
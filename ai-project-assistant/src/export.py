@@ -0,0 +1,200 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+try:
+    import pyarrow  # noqa: F401  (Parquet export)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+EXPORT_DIR = Path(__file__).resolve().parent.parent / "outputs" / "exports"
+EXPORT_CHUNK_ROWS = 50_000
+# finished artifacts are removed after this long
+EXPORT_TTL_SECONDS = 3600
+# Excel sheets hold 1,048,576 rows including the header; longer exports continue on a new sheet
+XLSX_SHEET_ROWS = 1_048_575
+FORMATS = {"CSV": "csv", "Excel": "xlsx", "Parquet": "parquet"}
+
+# few workers: exports are I/O heavy and should not starve the app of CPU
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+_jobs: dict = {}
+_lock = threading.Lock()
+
+class ExportJob:
+    def __init__(self, fmt: str, total: int, name: str):
+        self.id = uuid.uuid4().hex
+        self.fmt = fmt
+        self.total = total
+        self.written = 0
+        self.status = "queued"
+        self.error: Optional[str] = None
+        self.name = f"{name}.{FORMATS[fmt]}"
+        # per-request artifact; written under .part and renamed once complete
+        self.path = EXPORT_DIR / f"{self.id}.{FORMATS[fmt]}"
+        self.created = time.time()
+
+    @property
+    def progress(self) -> float:
+        return 1.0 if self.status == "done" else (self.written / self.total if self.total else 0.0)
+
+def _chunks(df: pd.DataFrame, rows: np.ndarray, chunk_rows: int):
+    for lo in range(0, len(rows), chunk_rows):
+        yield df.iloc[rows[lo:lo + chunk_rows]]
+
+def _write_csv(job: ExportJob, df: pd.DataFrame, rows: np.ndarray, tmp: Path, chunk_rows: int):
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        for i, chunk in enumerate(_chunks(df, rows, chunk_rows)):
+            chunk.to_csv(f, header=i == 0, index=False)
+            job.written += len(chunk)
+        if not len(rows):
+            df.head(0).to_csv(f, index=False)
+
+def _write_parquet(job: ExportJob, df: pd.DataFrame, rows: np.ndarray, tmp: Path, chunk_rows: int):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    writer = None
+    try:
+        for chunk in _chunks(df, rows, chunk_rows) if len(rows) else [df.head(0)]:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            # plain strings keep the schema identical across chunks
+            table = table.cast(pa.schema([pa.field(f.name, pa.string()) if pa.types.is_dictionary(f.type) else f for f in table.schema]))
+            writer = writer or pq.ParquetWriter(tmp, table.schema)
+            writer.write_table(table)
+            job.written += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def _xlsx_rows(chunk: pd.DataFrame):
+    return chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None)
+
+def _write_xlsx(job: ExportJob, df: pd.DataFrame, rows: np.ndarray, tmp: Path, chunk_rows: int):
+    # rows are streamed to disk instead of building the workbook in memory: XlsxWriter's
+    # constant_memory mode when installed (several times faster), else openpyxl write-only mode
+    header = [str(c) for c in df.columns]
+    sheet_name = lambda i: "Tasks" if i == 1 else f"Tasks {i}"
+    if xlsxwriter is not None:
+        wb = xlsxwriter.Workbook(str(tmp), {"constant_memory": True, "remove_timezone": True})
+        date_fmt = wb.add_format({"num_format": "yyyy-mm-dd hh:mm"})
+        ws, r, sheet = None, XLSX_SHEET_ROWS, 0
+        for chunk in _chunks(df, rows, chunk_rows) if len(rows) else [df.head(0)]:
+            for row in _xlsx_rows(chunk):
+                if r >= XLSX_SHEET_ROWS:
+                    sheet += 1
+                    ws = wb.add_worksheet(sheet_name(sheet))
+                    ws.write_row(0, 0, header)
+                    r = 0
+                r += 1
+                for c, v in enumerate(row):
+                    if v is None:
+                        continue
+                    if isinstance(v, pd.Timestamp):
+                        ws.write_datetime(r, c, v.to_pydatetime(), date_fmt)
+                    else:
+                        ws.write(r, c, v)
+            job.written += len(chunk)
+        if ws is None:
+            wb.add_worksheet(sheet_name(1)).write_row(0, 0, header)
+        wb.close()
+        return
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws, used, sheet = None, XLSX_SHEET_ROWS, 0
+    for chunk in _chunks(df, rows, chunk_rows):
+        for row in _xlsx_rows(chunk):
+            if used >= XLSX_SHEET_ROWS:
+                sheet += 1
+                ws = wb.create_sheet(sheet_name(sheet))
+                ws.append(header)
+                used = 0
+            ws.append(row)
+            used += 1
+        job.written += len(chunk)
+    if ws is None:
+        wb.create_sheet(sheet_name(1)).append(header)
+    wb.save(tmp)
+
+_WRITERS = {"CSV": _write_csv, "Excel": _write_xlsx, "Parquet": _write_parquet}
+
+def _run(job: ExportJob, df: pd.DataFrame, rows: np.ndarray, chunk_rows: int):
+    tmp = job.path.with_suffix(job.path.suffix + ".part")
+    job.status = "running"
+    try:
+        _WRITERS[job.fmt](job, df, rows, tmp, chunk_rows)
+        tmp.replace(job.path)
+        job.status = "done"
+    except Exception as e:
+        tmp.unlink(missing_ok=True)
+        job.status, job.error = "failed", str(e)
+
+def cleanup_exports(ttl: int = EXPORT_TTL_SECONDS) -> int:
+    # drop expired job records, then any artifact past its TTL (including leftovers from earlier runs)
+    now = time.time()
+    with _lock:
+        for job_id, job in list(_jobs.items()):
+            if job.status in ("done", "failed") and now - job.created > ttl:
+                del _jobs[job_id]
+        active = {job.path.name for job in _jobs.values()}
+    removed = 0
+    for p in EXPORT_DIR.glob("*"):
+        if p.name.split(".part")[0] not in active and now - p.stat().st_mtime > ttl:
+            p.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+def available_formats() -> list:
+    return [f for f in FORMATS if f != "Parquet" or HAS_PYARROW]
+
+def start_export(df: pd.DataFrame, rows: Optional[np.ndarray] = None, fmt: str = "CSV", name: str = "project_export",
+                 chunk_rows: int = EXPORT_CHUNK_ROWS) -> ExportJob:
+    # queues a chunked export of df.iloc[rows] and returns immediately; poll the job for progress
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    cleanup_exports()
+    rows = np.arange(len(df)) if rows is None else np.asarray(rows)
+    job = ExportJob(fmt, len(rows), name)
+    with _lock:
+        _jobs[job.id] = job
+    _executor.submit(_run, job, df, rows, chunk_rows)
+    return job
+
+def get_export(job_id: str) -> Optional[ExportJob]:
+    return _jobs.get(job_id)
+
+def render_export_jobs(key: str = "export_jobs", keep: int = 3):
+    # this session's recent exports. Finished ones render with the page; only queued/running jobs sit in
+    # a fragment that polls every second, so download files are not re-read on every poll
+    def _recent() -> list:
+        return [j for j in (get_export(i) for i in st.session_state.get(key, [])[-keep:]) if j is not None]
+
+    def _progress():
+        running = [j for j in _recent() if j.status in ("queued", "running")]
+        for job in reversed(running):
+            st.progress(job.progress, text=f"Exporting {job.name}: {job.written:,} / {job.total:,} rows")
+        if not running:
+            # the last job just finished: rerun the page so its download shows up and polling stops
+            st.rerun()
+
+    jobs = _recent()
+    for job in reversed(jobs):
+        if job.status == "done":
+            with open(job.path, "rb") as f:
+                st.download_button(f"Download {job.name} ({job.total:,} rows)", f, file_name=job.name, key=f"dl_{job.id}")
+        elif job.status == "failed":
+            st.error(f"Export {job.name} failed: {job.error}")
+    if any(j.status in ("queued", "running") for j in jobs):
+        st.fragment(run_every=1.0)(_progress)()
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from typing import Optional
+from src.data_loader import dataset_version
+
+FACET_COLUMNS = ["Status","Assignee","Epic","Priority"]
+
+class FacetIndex:
+    # per column: integer codes plus sorted row ids per value (CSR), so a value's rows are a slice
+    def __init__(self, df: pd.DataFrame):
+        self.n = len(df)
+        self.codes, self.labels, self.indptr, self.rows = {}, {}, {}, {}
+        for col in FACET_COLUMNS:
+            if col not in df.columns:
+                continue
+            s = df[col]
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                codes, labels = s.cat.codes.to_numpy().astype(np.int32), s.cat.categories
+            else:
+                codes, labels = pd.factorize(s)
+                codes = codes.astype(np.int32)
+            present = np.flatnonzero(codes >= 0)
+            order = present[np.argsort(codes[present], kind="stable")]
+            indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(codes[present], minlength=len(labels)), out=indptr[1:])
+            self.codes[col], self.labels[col] = codes, pd.Index(labels).astype(str)
+            self.indptr[col], self.rows[col] = indptr, order
+        due = df["Due Date"].to_numpy(dtype="datetime64[ns]")
+        # NaT sorts last, so "due before now" is always a prefix of this permutation
+        self.due = due
+        self.due_order = np.argsort(due, kind="stable")
+        self.due_sorted = due[self.due_order]
+        self.done_code = self.labels["Status"].get_loc("Done") if "Done" in self.labels.get("Status", []) else -2
+
+    def counts(self, col: str) -> np.ndarray:
+        return np.diff(self.indptr[col])
+
+    def value_codes(self, col: str, values) -> np.ndarray:
+        pos = self.labels[col].get_indexer([str(v) for v in values])
+        return pos[pos >= 0]
+
+    def rows_for(self, col: str, values) -> np.ndarray:
+        codes = self.value_codes(col, values)
+        ptr = self.indptr[col]
+        parts = [self.rows[col][ptr[c]:ptr[c + 1]] for c in codes]
+        # postings of different values are disjoint, so the union is a plain sort
+        return np.sort(np.concatenate(parts)) if len(parts) > 1 else (parts[0] if parts else np.empty(0, dtype=np.int64))
+
+    def due_before(self, now: pd.Timestamp) -> int:
+        return int(np.searchsorted(self.due_sorted, np.datetime64(now.to_datetime64(), "ns"), side="left"))
+
+class _Predicate:
+    def __init__(self, name: str, estimate: int, rows, test):
+        self.name, self.estimate, self.rows, self.test = name, estimate, rows, test
+
+def _facet(ix: FacetIndex, col: str, values, name: Optional[str] = None) -> _Predicate:
+    codes = ix.value_codes(col, values)
+    # code -1 (missing) indexes the trailing False slot
+    lookup = np.zeros(len(ix.labels[col]) + 1, dtype=bool)
+    lookup[codes] = True
+    return _Predicate(name or col, int(ix.counts(col)[codes].sum()), lambda: ix.rows_for(col, values),
+                      lambda r: lookup[ix.codes[col][r]])
+
+def _predicates(ix: FacetIndex, facets: dict, search: Optional[np.ndarray], overdue: bool, blocked: bool,
+                now: pd.Timestamp) -> list:
+    preds = [_facet(ix, col, values) for col, values in facets.items() if values and col in ix.codes]
+    if search is not None:
+        preds.append(_Predicate("Search", len(search), lambda: search,
+                                lambda r: np.isin(r, search, assume_unique=True)))
+    if blocked and "Status" in ix.codes:
+        preds.append(_facet(ix, "Status", ["Blocked"], "Blocked"))
+    if overdue:
+        # past due and not Done, matching the Overdue KPI; the due-date prefix length is the estimate
+        cut = np.datetime64(now.to_datetime64(), "ns")
+        status = ix.codes.get("Status", np.full(ix.n, -1, dtype=np.int32))
+        open_rows = lambda r: r[status[r] != ix.done_code]
+        preds.append(_Predicate("Overdue", ix.due_before(now),
+                                lambda: open_rows(np.sort(ix.due_order[:ix.due_before(now)])),
+                                lambda r: (ix.due[r] < cut) & (status[r] != ix.done_code)))
+    return preds
+
+def run_plan(preds: list, n: int):
+    # cheapest predicate (smallest estimated result) produces the candidates; the rest only test them
+    if not preds:
+        return np.arange(n), []
+    preds = sorted(preds, key=lambda p: p.estimate)
+    rows = preds[0].rows()
+    steps = [(preds[0].name, len(rows))]
+    for p in preds[1:]:
+        if not len(rows):
+            break
+        rows = rows[p.test(rows)]
+        steps.append((p.name, len(rows)))
+    return rows, steps
+
+def filter_rows(df: pd.DataFrame, facets: dict, search: Optional[np.ndarray] = None, overdue: bool = False,
+                blocked: bool = False, now: Optional[pd.Timestamp] = None):
+    # sorted row positions matching every filter, plus the executed plan as (predicate, rows left) steps;
+    # callers slice only what they display, the frame itself is never copied
+    ix = get_facet_index(df)
+    now = pd.Timestamp.now() if now is None else now
+    return run_plan(_predicates(ix, facets, search, overdue, blocked, now), ix.n)
+
+def facet_counts(df: pd.DataFrame, col: str, facets: dict, search: Optional[np.ndarray] = None,
+                 overdue: bool = False, blocked: bool = False, now: Optional[pd.Timestamp] = None) -> pd.Series:
+    # per-value counts for `col` under every other active filter (the usual facet semantics)
+    ix = get_facet_index(df)
+    if col not in ix.codes:
+        return pd.Series(dtype=np.int64)
+    others = {c: v for c, v in facets.items() if c != col}
+    if not (any(others.values()) or search is not None or overdue or blocked):
+        counts = ix.counts(col)
+    else:
+        rows, _ = filter_rows(df, others, search, overdue, blocked, now)
+        codes = ix.codes[col][rows]
+        counts = np.bincount(codes[codes >= 0], minlength=len(ix.labels[col]))
+    return pd.Series(counts, index=ix.labels[col])
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _cached_facets(_df: pd.DataFrame, version: str) -> FacetIndex:
+    return FacetIndex(_df)
+
+def get_facet_index(df: pd.DataFrame) -> FacetIndex:
+    return _cached_facets(df, dataset_version(df))
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from pathlib import Path
+from typing import Optional
+from src.data_loader import dataset_version
+from src.snapshots import burndown_series, snapshot_stamp, snapshot_store
+
+TRIALS = 20_000
+HISTORY_WEEKS = 26
+# fewer recorded weeks than this and the snapshot history is not trusted over task dates
+MIN_SNAPSHOT_WEEKS = 6
+MAX_HORIZON_WEEKS = 520
+PERCENTILES = [50, 85, 95]
+
+def weekly_throughput(df: pd.DataFrame, now: pd.Timestamp, weeks: int = HISTORY_WEEKS) -> pd.DataFrame:
+    # done story points per week (rows) and epic (columns); completion date is Resolved Date when known, else Due Date.
+    # Only complete weeks count, from the first week with a created or completed task: weeks before the
+    # project existed and the week in progress would read as zero throughput
+    done = (df["Status"] == "Done").to_numpy()
+    when = df["Due Date"]
+    if "Resolved Date" in df.columns:
+        when = df["Resolved Date"].fillna(when)
+    end = now.to_period("W-SUN").start_time
+    first = pd.concat([df["Created Date"], when[done]]).min()
+    start = end - pd.Timedelta(weeks=weeks)
+    if pd.notna(first):
+        start = max(start, first.to_period("W-SUN").start_time)
+    week_index = pd.date_range(start, end, freq="W-MON", inclusive="left")
+    recent = done & (when >= start).to_numpy() & (when < end).to_numpy()
+    if not recent.any():
+        return pd.DataFrame(index=week_index)
+    sub = pd.DataFrame({"week": when[recent].dt.to_period("W-SUN").dt.start_time,
+                        "epic": df["Epic"][recent].astype(str), "points": df["Story Points"][recent]})
+    table = sub.pivot_table(index="week", columns="epic", values="points", aggfunc="sum", fill_value=0)
+    return table.reindex(week_index, fill_value=0)
+
+def snapshot_throughput(store: Path, weeks: int = HISTORY_WEEKS) -> Optional[np.ndarray]:
+    # weekly increase of done points from the project's recorded snapshots; None when history is too short
+    series = burndown_series(store, freq="W")
+    if len(series) < MIN_SNAPSHOT_WEEKS + 1:
+        return None
+    return series["done"].diff().dropna().clip(lower=0).to_numpy()[-weeks:]
+
+def simulate_weeks(remaining: float, history: np.ndarray, trials: int = TRIALS, seed: int = 0) -> np.ndarray:
+    # weeks to burn `remaining` points: each trial draws weekly throughput from history (bootstrap),
+    # all trials advance together as one array; trials still short at MAX_HORIZON_WEEKS report one past it
+    if remaining <= 0:
+        return np.zeros(trials, dtype=np.int32)
+    history = np.asarray(history, dtype=np.float64)
+    if not len(history) or history.max() <= 0:
+        return np.full(trials, MAX_HORIZON_WEEKS + 1, dtype=np.int32)
+    rng = np.random.default_rng(seed)
+    values = history.astype(np.float32)
+    # draw a few weeks at a time and stop once every trial has finished, instead of sizing for the worst case
+    block = int(min(MAX_HORIZON_WEEKS, max(4, np.ceil(0.5 * remaining / history.mean()))))
+    weeks = np.full(trials, MAX_HORIZON_WEEKS + 1, dtype=np.int32)
+    done = np.zeros(trials, dtype=np.float32)
+    pending = np.arange(trials)
+    for start in range(0, MAX_HORIZON_WEEKS, block):
+        width = min(block, MAX_HORIZON_WEEKS - start)
+        progress = done[pending, None] + np.cumsum(values[rng.integers(0, len(values), (len(pending), width))], axis=1)
+        hit = progress >= remaining
+        finished = hit.any(axis=1)
+        weeks[pending[finished]] = start + hit[finished].argmax(axis=1) + 1
+        done[pending] = progress[:, -1]
+        pending = pending[~finished]
+        if not len(pending):
+            break
+    return weeks
+
+def forecast_delivery(df: pd.DataFrame, now: Optional[pd.Timestamp] = None, trials: int = TRIALS,
+                      seed: int = 0, overall_history: Optional[np.ndarray] = None) -> pd.DataFrame:
+    # P50/P85/P95 completion dates and on-time probability, overall and per epic
+    now = pd.Timestamp.now().normalize() if now is None else now
+    open_ = (df["Status"] != "Done").to_numpy()
+    epics = df["Epic"].astype(str).to_numpy()[open_]
+    remaining = pd.Series(df["Story Points"].to_numpy()[open_], index=epics).groupby(level=0).sum()
+    deadline = pd.Series(df["Due Date"].to_numpy()[open_], index=epics).groupby(level=0).max()
+    table = weekly_throughput(df, now)
+    total_hist = overall_history if overall_history is not None else table.sum(axis=1).to_numpy()
+    rows = [("Overall", remaining.sum(), total_hist, deadline.max() if len(deadline) else pd.NaT, "snapshots" if overall_history is not None else "tasks")]
+    for epic, pts in remaining.items():
+        hist = table[epic].to_numpy() if epic in table.columns else np.zeros(0)
+        rows.append((epic, pts, hist, deadline.get(epic, pd.NaT), "tasks"))
+    out = []
+    for i, (name, pts, hist, due, source) in enumerate(rows):
+        weeks = simulate_weeks(pts, hist, trials, seed + i)
+        q = np.percentile(weeks, PERCENTILES)
+        beyond = weeks > MAX_HORIZON_WEEKS
+        on_time = np.nan
+        if pd.notna(due):
+            on_time = round(float((now + pd.to_timedelta(weeks * 7, unit="D") <= due).mean() * 100), 1)
+        out.append({
+            "Scope": name, "Remaining SP": int(pts),
+            "Weekly SP (mean)": round(float(np.mean(hist)), 1) if len(hist) else 0.0,
+            **{f"P{p}": (now + pd.Timedelta(weeks=float(w))) if w <= MAX_HORIZON_WEEKS else pd.NaT for p, w in zip(PERCENTILES, q)},
+            "On-time %": on_time, "Latest due": due, "No forecast %": round(float(beyond.mean() * 100), 1), "History": source
+        })
+    return pd.DataFrame(out).set_index("Scope")
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _cached_forecast(_df: pd.DataFrame, version: str, store: str, stamp: float, day: pd.Timestamp, trials: int) -> pd.DataFrame:
+    return forecast_delivery(_df, day, trials, overall_history=snapshot_throughput(Path(store)))
+
+def get_forecast(df: pd.DataFrame, trials: int = TRIALS) -> pd.DataFrame:
+    # recomputed per dataset version, snapshot history change, or day
+    store = snapshot_store(df)
+    return _cached_forecast(df, dataset_version(df), str(store), snapshot_stamp(store), pd.Timestamp.now().normalize(), trials)
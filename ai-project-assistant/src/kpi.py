@@ -2,33 +2,87 @@
 import streamlit as st
 import plotly.express as px
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from src.data_loader import dataset_version, DEPENDENCY_COLUMN
+from src.cube import get_kpi_cube, cube_kpis, cube_rollup, reference_time
+from src.snapshots import burndown_series, snapshot_stamp, snapshot_store
+from src.dependencies import get_dependency_analysis
+from src.dedup import duplicate_mask
+from src.forecast import get_forecast, TRIALS, HISTORY_WEEKS
 
-@st.cache_data
-def calculate_kpis(df: pd.DataFrame) -> dict:
+UNASSIGNED = "Unassigned"
+EMPTY_KPIS = {"total":0,"completed":0,"in_progress":0,"blocked":0,"overdue":0,"completion_rate":0.0,"velocity":0}
+
+def _status_codes(df: pd.DataFrame):
+    status = df["Status"]
+    if not isinstance(status.dtype, pd.CategoricalDtype):
+        status = status.astype("category")
+    return status.cat.codes.to_numpy(), status.cat.categories
+
+def compute_kpis(df: pd.DataFrame, now: Optional[pd.Timestamp] = None) -> dict:
+    # one pass over pre-encoded status codes: a bincount gives every status counter at once
     if df is None or df.empty:
-        return {"total":0,"completed":0,"in_progress":0,"blocked":0,"overdue":0,"completion_rate":0.0,"velocity":0}
+        return dict(EMPTY_KPIS)
+    now = now or pd.Timestamp.now()
+    codes, cats = _status_codes(df)
+    counts = dict(zip(cats, np.bincount(codes[codes >= 0], minlength=len(cats)).tolist()))
+    done_code = cats.get_loc("Done") if "Done" in cats else -2
+    due = df["Due Date"].to_numpy(dtype="datetime64[ns]")
+    # NaT compares False, so missing due dates never count as overdue
+    overdue = int(np.count_nonzero((due < np.datetime64(now.to_datetime64(), "ns")) & (codes != done_code)))
     total = len(df)
-    completed = int((df["Status"].astype(str).str.lower() == "done").sum())
-    in_progress = int((df["Status"].astype(str).str.lower() == "in progress").sum())
-    blocked = int((df["Status"].astype(str).str.lower() == "blocked").sum())
-    velocity = int(pd.to_numeric(df["Story Points"], errors="coerce").fillna(0).sum())
-    now = pd.Timestamp.now()
-    overdue = int(((df["Due Date"].notna()) & (df["Due Date"] < now) & (df["Status"].astype(str).str.lower() != "done")).sum())
-    completion_rate = round((completed / total * 100), 2) if total else 0.0
+    completed = counts.get("Done", 0)
     return {
-        "total":total, "completed":completed, "in_progress":in_progress,
-        "blocked":blocked, "overdue":overdue, "completion_rate":completion_rate, "velocity":velocity
+        "total":total, "completed":completed, "in_progress":counts.get("In Progress", 0),
+        "blocked":counts.get("Blocked", 0), "overdue":overdue,
+        "completion_rate":round((completed / total * 100), 2) if total else 0.0,
+        "velocity":int(df["Story Points"].to_numpy().sum())
     }
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_kpis(_df: pd.DataFrame, version: str, minute: pd.Timestamp, exclude_duplicates: bool = False) -> dict:
+    # _df is not hashed; the dataset version plus the current minute (for overdue) is the key
+    if exclude_duplicates:
+        return compute_kpis(_df[~duplicate_mask(_df)], minute)
+    return compute_kpis(_df, minute)
+
+def calculate_kpis(df: pd.DataFrame, exclude_duplicates: bool = False) -> dict:
+    # exclude_duplicates drops near-duplicate tasks, keeping the earliest created task of each cluster
+    if df is None or df.empty:
+        return dict(EMPTY_KPIS)
+    return _cached_kpis(df, dataset_version(df), reference_time(), exclude_duplicates)
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _cached_burndown(store: str, stamp: float) -> pd.DataFrame:
+    return burndown_series(Path(store))
+
 def display_kpi_dashboard():
     df = st.session_state.get("project_data", None)
-    kpis = calculate_kpis(df) if df is not None else None
-
-    if not kpis:
+    if df is None:
         st.info("Upload data to view KPIs")
         return
 
+    # slices are answered from the per-version KPI cube instead of re-scanning rows
+    cube = get_kpi_cube(df)
+    f1, f2 = st.columns(2)
+    epic_sel = f1.multiselect("Epic", options=sorted(cube["Epic"].dropna().unique().tolist()), key="dash_epic")
+    assignee_sel = f2.multiselect("Assignee", options=sorted(cube["Assignee"].dropna().unique().tolist()), key="dash_assignee")
+    filters = {"Epic": epic_sel, "Assignee": assignee_sel}
+    dedup = st.checkbox("Exclude near-duplicate tasks from KPIs", value=False, key="dash_dedup")
+    if dedup and (epic_sel or assignee_sel):
+        keep = ~duplicate_mask(df)
+        for col, sel in filters.items():
+            if sel:
+                keep &= df[col].isin(sel).to_numpy()
+        kpis = compute_kpis(df[keep], reference_time())
+    elif epic_sel or assignee_sel:
+        kpis = cube_kpis(cube, **filters)
+    else:
+        kpis = calculate_kpis(df, exclude_duplicates=dedup)
+
     # Metric cards
     c1,c2,c3,c4 = st.columns(4)
     c1.metric("✅ Completed", kpis["completed"], f"{kpis['completion_rate']:.1f}%")
@@ -36,31 +90,132 @@ def display_kpi_dashboard():
     c3.metric("⚠️ Blocked", kpis["blocked"])
     c4.metric("📅 Overdue", kpis["overdue"])
 
-    # Burndown simulation
-    st.markdown("### 📈 Burndown (simulated)")
+    st.markdown("### 👥 Breakdown")
+    by = st.selectbox("Group by", ["Assignee","Epic","Priority"], key="dash_breakdown")
+    st.dataframe(cube_rollup(cube, by, **filters), use_container_width=True)
+
+    # Monte Carlo delivery forecast, cached per dataset version
+    st.markdown("### 🔮 Delivery forecast")
+    forecast = get_forecast(df)
+    overall = forecast.loc["Overall"]
+    f1, f2, f3, f4 = st.columns(4)
+    for col, p in zip((f1, f2, f3), ("P50", "P85", "P95")):
+        col.metric(f"{p} completion", overall[p].strftime("%Y-%m-%d") if pd.notna(overall[p]) else "—")
+    f4.metric("On-time probability", f"{overall['On-time %']:.0f}%" if pd.notna(overall["On-time %"]) else "—")
+    epics = forecast.drop(index="Overall")
+    if epic_sel:
+        epics = epics[epics.index.isin([str(e) for e in epic_sel])]
+    st.dataframe(epics.drop(columns=["History"]), use_container_width=True)
+    st.caption(f"{TRIALS:,} trials per scope, bootstrapping weekly throughput from "
+               + ("recorded snapshots" if overall["History"] == "snapshots" else "completed tasks")
+               + f" over the last {HISTORY_WEEKS} weeks.")
+
+    # Burndown from recorded snapshots (one per distinct load)
+    st.markdown("### 📈 Burndown")
+    store = snapshot_store(df)
+    history = _cached_burndown(str(store), snapshot_stamp(store))
     total_points = int(df["Story Points"].sum()) if "Story Points" in df.columns else 0
-    if total_points > 0:
+    if len(history) >= 2:
+        end = max(df["Due Date"].max(), history.index[-1]) if df["Due Date"].notna().any() else history.index[-1]
+        start_remaining = history["remaining"].iloc[0]
+        chart = history.rename(columns={"remaining":"Remaining SP","done":"Done SP (burnup)","scope":"Scope SP"})
+        ideal_x = pd.DatetimeIndex([history.index[0], end])
+        fig = px.line(chart, labels={"index":"Date", "value":"Story Points", "variable":""}, title="Burndown / burnup (actual)")
+        fig.add_scatter(x=ideal_x, y=[start_remaining, 0], mode="lines", name="Ideal", line=dict(dash="dash"))
+        st.plotly_chart(fig, use_container_width=True)
+    elif total_points > 0:
         dates = pd.date_range(pd.Timestamp.now() - pd.Timedelta(days=30), periods=40)
         ideal = [total_points - (total_points * i / (len(dates)-1)) for i in range(len(dates))]
-        actual = ideal.copy()
-        fig = px.line(x=dates, y=[ideal, actual], labels={"x":"Date", "value":"Remaining SP"}, title="Burndown (ideal vs actual)")
+        fig = px.line(x=dates, y=ideal, labels={"x":"Date", "y":"Remaining SP"}, title="Burndown (ideal)")
         st.plotly_chart(fig, use_container_width=True)
+        st.caption("The actual line appears once at least two snapshots have been recorded (one per upload).")
+
+# above this many visible tasks the timeline switches to merged per-lane bars
+GANTT_DETAIL_LIMIT = 2000
+# hard cap on bars sent to the browser in lane mode
+GANTT_MAX_BARS = 3000
+# gap tolerances tried in turn until lane bars fit the cap
+GANTT_MERGE_GAPS = ["0D", "1D", "7D", "30D", "90D", "365D"]
+
+def merge_intervals(df: pd.DataFrame, lane: str, gap: str = "0D") -> pd.DataFrame:
+    # merge overlapping (or closer than `gap`) task intervals per lane in one sorted pass
+    start = df["Created Date"].to_numpy()
+    end = np.maximum(df["Due Date"].to_numpy(), start)
+    cat = df[lane].astype("category")
+    if cat.isna().any():
+        # tasks without an assignee/epic share an explicit lane instead of code -1
+        if UNASSIGNED not in cat.cat.categories:
+            cat = cat.cat.add_categories([UNASSIGNED])
+        cat = cat.fillna(UNASSIGNED)
+    lanes = cat.cat.codes.to_numpy()
+    order = np.lexsort((start, lanes))
+    lanes, start, end = lanes[order], start[order], end[order]
+    points = df["Story Points"].to_numpy()[order]
+    # running max of end within each lane; a bar starts where a task begins after everything before it ended
+    reach = pd.Series(end).groupby(lanes).cummax().to_numpy()
+    new_bar = np.ones(len(start), dtype=bool)
+    new_bar[1:] = (lanes[1:] != lanes[:-1]) | (start[1:] > reach[:-1] + pd.Timedelta(gap).to_timedelta64())
+    bar = np.cumsum(new_bar) - 1
+    bars = pd.DataFrame({"lane": lanes, "start": start, "end": end, "points": points}).groupby(bar).agg(
+        lane=("lane", "first"), Start=("start", "min"), End=("end", "max"), Tasks=("start", "size"), Points=("points", "sum"))
+    bars[lane] = cat.cat.categories.take(bars.pop("lane")).astype(str)
+    return bars
 
 def render_gantt_timeline(df: pd.DataFrame):
-    # Uses Plotly timeline
+    # Uses Plotly timeline; level of detail depends on how many tasks fall in the visible window
     if df is None or df.empty:
         st.info("No data for timeline")
         return
     if "Due Date" not in df.columns or "Created Date" not in df.columns:
         st.warning("Missing Created Date / Due Date columns for timeline")
         return
-    df_t = df.copy()
-    # start = Created Date, end = Due Date
-    df_t = df_t.dropna(subset=["Created Date","Due Date"])
-    if df_t.empty:
+    # start = Created Date, end = Due Date; only the columns the chart needs, no full-frame copy
+    dated = df["Created Date"].notna().to_numpy() & df["Due Date"].notna().to_numpy()
+    if not dated.any():
         st.info("No rows with both Created Date and Due Date")
         return
-    fig = px.timeline(df_t, x_start="Created Date", x_end="Due Date", y="Assignee", color="Priority", hover_data=["Task","Status"])
+    lo, hi = df["Created Date"].min().date(), df["Due Date"].max().date()
+    has_deps = DEPENDENCY_COLUMN in df.columns
+    c1, c2, c3 = st.columns([3, 1, 1])
+    critical_only = c3.checkbox("Critical path only", value=False, disabled=not has_deps, key="gantt_critical")
+    window = c1.slider("Visible window", min_value=lo, max_value=max(hi, lo), value=(lo, max(hi, lo)), key="gantt_window") if hi > lo else (lo, hi)
+    lane = c2.selectbox("Lanes", ["Assignee", "Epic"], key="gantt_lane")
+    w0, w1 = pd.Timestamp(window[0]), pd.Timestamp(window[1]) + pd.Timedelta(days=1)
+    visible = dated & (df["Created Date"] < w1).to_numpy() & (df["Due Date"] >= w0).to_numpy()
+    critical = None
+    if has_deps:
+        deps = get_dependency_analysis(df)
+        critical = deps["schedule"]["Critical"].to_numpy() & (deps["edges"] > 0)
+        st.caption(f"{deps['edges']:,} dependencies • critical path {len(deps['critical_path']):,} tasks, "
+                   f"{deps['project_days']:,.0f} days" + (f" • {deps['cyclic']:,} tasks in or behind a cycle" if deps["cyclic"] else ""))
+        if critical_only:
+            visible &= critical
+    rows = np.flatnonzero(visible)
+    if not len(rows):
+        st.info("No tasks in the selected window")
+        return
+
+    if len(rows) <= GANTT_DETAIL_LIMIT:
+        df_t = df.iloc[rows][["Created Date","Due Date",lane,"Priority","Task","Status"]]
+        color = "Priority"
+        if critical is not None:
+            df_t = df_t.assign(Critical=np.where(critical[rows], "Critical path", "Has slack"))
+            color = "Critical"
+        fig = px.timeline(df_t, x_start="Created Date", x_end="Due Date", y=lane, color=color, hover_data=["Task","Status","Priority"])
+        title = f"Project Timeline ({len(rows):,} tasks)"
+    else:
+        sub = df.iloc[rows][["Created Date","Due Date",lane,"Story Points"]]
+        for gap in GANTT_MERGE_GAPS:
+            bars = merge_intervals(sub, lane, gap)
+            if len(bars) <= GANTT_MAX_BARS:
+                break
+        # keep the busiest lanes if even the coarsest merge is over the cap
+        bars = bars.nlargest(GANTT_MAX_BARS, "Tasks")
+        bars["Start"] = bars["Start"].clip(lower=w0)
+        bars["End"] = bars["End"].clip(upper=w1)
+        fig = px.timeline(bars, x_start="Start", x_end="End", y=lane, color="Tasks", hover_data=["Tasks","Points"],
+                          color_continuous_scale="Blues")
+        title = f"Project Timeline ({len(rows):,} tasks merged into {len(bars):,} lane bars, gap {gap}) — narrow the window to see tasks"
     fig.update_yaxes(autorange="reversed")
-    fig.update_layout(height=600, template="plotly_white", title="Project Timeline")
+    fig.update_layout(height=600, template="plotly_white", title=title)
     st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+from typing import Optional
+from src.data_loader import STATUS_VOCAB, PRIORITY_VOCAB, invalid_counts
+
+MANDATORY = ["Task ID","Task","Status","Assignee","Due Date"]
+# placeholders normalize_schema writes for missing values count as missing here
+PLACEHOLDERS = {"Task": "Untitled Task"}
+MAX_STORY_POINTS = 100
+STALE_DAYS = 30
+# above this many rows the dashboard profiles a uniform sample by default
+QUALITY_SAMPLE_ROWS = 200_000
+Z95 = 1.96
+
+def _in_vocab(s: pd.Series, vocab: list) -> np.ndarray:
+    # normalized frames keep the vocabulary first in the categories, unknown labels after it
+    if isinstance(s.dtype, pd.CategoricalDtype) and list(s.cat.categories[:len(vocab)]) == vocab:
+        codes = s.cat.codes.to_numpy()
+        return (codes >= 0) & (codes < len(vocab))
+    return s.isin(vocab).to_numpy()
+
+def _margin(x: np.ndarray, population: int) -> float:
+    # 95% half-width of a sample mean, with finite population correction
+    n = len(x)
+    if n < 2 or n >= population:
+        return 0.0
+    return float(Z95 * x.std(ddof=1) / np.sqrt(n) * np.sqrt((population - n) / (population - 1)))
+
+def profile_quality(df: pd.DataFrame, sample_rows: Optional[int] = None, seed: int = 0,
+                    now: Optional[pd.Timestamp] = None) -> dict:
+    # every row-level check is one vectorized pass over the (optionally sampled) frame;
+    # scores are means of per-row scores, so a sample yields an estimate plus a 95% margin
+    now = pd.Timestamp.now() if now is None else now
+    total = len(df)
+    if total == 0:
+        return {"rows": 0, "checked": 0, "metrics": {}, "issues": pd.DataFrame(columns=["check","metric","rows"])}
+    if sample_rows and total > sample_rows:
+        pick = np.sort(np.random.default_rng(seed).choice(total, sample_rows, replace=False))
+        s = df.iloc[pick]
+    else:
+        s = df
+    n = len(s)
+    scale = total / n
+    issues = {}
+
+    # completeness: share of mandatory cells filled per row
+    cols = [c for c in MANDATORY if c in s.columns]
+    filled = np.zeros(n)
+    for c in cols:
+        ok = s[c].notna().to_numpy()
+        if c in PLACEHOLDERS:
+            ok &= (s[c] != PLACEHOLDERS[c]).to_numpy()
+        issues[("Completeness", f"Missing {c}")] = n - int(ok.sum())
+        filled += ok
+    completeness = filled / max(len(cols), 1)
+
+    # validity: known status / priority labels, story points in range, values that failed to parse
+    checks = {
+        "Unknown status": _in_vocab(s["Status"], STATUS_VOCAB),
+        "Unknown priority": _in_vocab(s["Priority"], PRIORITY_VOCAB),
+        "Story points out of range": s["Story Points"].between(0, MAX_STORY_POINTS).to_numpy()
+    }
+    validity = np.zeros(n)
+    for name, ok in checks.items():
+        issues[("Validity", name)] = n - int(ok.sum())
+        validity += ok
+    # parse failures are counted exactly at load time, so they apply as a population rate
+    unparsed = invalid_counts(df)
+    for col, bad in unparsed.items():
+        issues[("Validity", f"Unparseable {col}")] = bad / scale
+    validity = validity / len(checks)
+    parse_rate = sum(unparsed.values()) / (total * len(checks)) if unparsed else 0.0
+
+    # consistency: dates in a sensible order, resolution only on finished work
+    created, due = s["Created Date"], s["Due Date"]
+    rules = {
+        "Due before created": (due < created).to_numpy(),
+        "Created in the future": (created > now).to_numpy()
+    }
+    if "Resolved Date" in s.columns:
+        resolved = s["Resolved Date"].notna()
+        rules["Resolved but not Done"] = (resolved & (s["Status"] != "Done")).to_numpy()
+        rules["Resolved before created"] = (s["Resolved Date"] < created).to_numpy()
+    broken = np.zeros(n, dtype=bool)
+    for name, bad in rules.items():
+        issues[("Consistency", name)] = int(bad.sum())
+        broken |= bad
+    consistency = (~broken).astype(float)
+
+    # uniqueness: duplicate IDs are found exactly on the full column (one hash pass)
+    dup = int(df["Task ID"].duplicated().sum())
+    issues[("Uniqueness", "Duplicate Task ID")] = dup / scale
+
+    # timeliness: open tasks touched within STALE_DAYS (Updated Date when present, else Created Date)
+    touched = s["Updated Date"].fillna(created) if "Updated Date" in s.columns else created
+    open_ = (s["Status"] != "Done").to_numpy()
+    fresh = (touched >= now - pd.Timedelta(days=STALE_DAYS)).to_numpy()[open_].astype(float)
+    issues[("Timeliness", f"Open and stale > {STALE_DAYS}d")] = int(len(fresh) - fresh.sum())
+
+    def metric(x: np.ndarray, penalty: float = 0.0) -> dict:
+        score = (float(x.mean()) - penalty) if len(x) else 1.0
+        return {"score": round(max(score, 0.0) * 100, 1), "margin": round(_margin(x, total) * 100, 2)}
+
+    metrics = {
+        "Completeness": metric(completeness),
+        "Validity": metric(validity, parse_rate),
+        "Consistency": metric(consistency),
+        "Uniqueness": {"score": round((1 - dup / total) * 100, 1), "margin": 0.0},
+        "Timeliness": metric(fresh)
+    }
+    table = pd.DataFrame([(m, c, int(round(v * scale))) for (m, c), v in issues.items() if v],
+                         columns=["metric","check","rows"])
+    return {"rows": total, "checked": n, "metrics": metrics, "issues": table}
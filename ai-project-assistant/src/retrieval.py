@@ -0,0 +1,138 @@
+import time
+import numpy as np
+import pandas as pd
+import streamlit as st
+from typing import Optional
+from src.data_loader import dataset_version
+from src.text import STOPWORDS, csr, tokenize, tokenize_series
+
+RETRIEVAL_COLUMNS = ["Task","Description","Epic"]
+BM25_K1 = 1.2
+BM25_B = 0.75
+TOP_ROWS = 12
+# query terms at least this long also match longer tokens ("payment" -> "payments")
+PREFIX_MIN = 4
+QUESTION_WORDS = {"what","which","who","whom","how","why","when","where","s","me","show","tell","about","any",
+                  "our","we","i","there","do","does","did","can","should","list","give"}
+# Blocked first, Done last when scores tie: the most actionable rows make the prompt
+_STATUS_RANK = {"Blocked": 0, "In Progress": 1, "Review": 1, "Todo": 2, "Done": 3}
+_DESC_CHARS = 80
+
+class BM25Index:
+    # Okapi BM25 over distinct (Task, Description, Epic) texts, with corpus statistics weighted by how
+    # many rows share each text, so repeated tracker templates count like the rows they stand for
+    def __init__(self, df: pd.DataFrame, columns: list = RETRIEVAL_COLUMNS):
+        start = time.perf_counter()
+        cols = [c for c in columns if c in df.columns]
+        codes = np.zeros(len(df), dtype=np.int64)
+        for c in cols:
+            col = pd.factorize(df[c])[0]
+            codes = codes * (int(col.max()) + 2) + col
+        codes, uniques = pd.factorize(codes)
+        firsts = np.full(len(uniques), len(df), dtype=np.int64)
+        np.minimum.at(firsts, codes, np.arange(len(df)))
+        sub = df.iloc[firsts]
+        text = sub[cols[0]].astype(str) if cols else pd.Series("", index=sub.index)
+        for c in cols[1:]:
+            text = text + " " + sub[c].astype(str)
+        tokens = tokenize_series(text).reset_index(drop=True).explode().dropna()
+        doc_len = np.bincount(tokens.index.to_numpy(), minlength=len(uniques)).astype(np.float64)
+        tok_codes, vocab = pd.factorize(tokens, sort=True)
+        # (token, text) pairs with their term frequency
+        pair, tf = np.unique(tok_codes.astype(np.int64) * len(uniques) + tokens.index.to_numpy(), return_counts=True)
+        tok, doc = pair // len(uniques), pair % len(uniques)
+        self.vocab = np.asarray(vocab, dtype=str)
+        # np.unique already sorted the pairs by (token, text), so they are the postings in order
+        self.indptr = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tok, minlength=len(self.vocab)), out=self.indptr[1:])
+        self.post_docs, self.post_tf = doc.astype(np.int32), tf.astype(np.float32)
+        self.doc_rows = np.bincount(codes, minlength=len(uniques))
+        self.text_rows, self.rows = csr(codes, np.arange(len(df)), len(uniques))
+        self.n = len(df)
+        df_rows = np.add.reduceat(self.doc_rows[self.post_docs], self.indptr[:-1]) if len(self.post_docs) else np.zeros(0)
+        self.idf = np.log1p((self.n - df_rows + 0.5) / (df_rows + 0.5))
+        avgdl = float((doc_len * self.doc_rows).sum() / max(self.n, 1)) or 1.0
+        self.norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len / avgdl)
+        self.build_seconds = time.perf_counter() - start
+
+    def _terms(self, query: str) -> np.ndarray:
+        # vocabulary ids for the query: exact tokens, plus prefix matches for longer terms
+        ids = []
+        for term in set(tokenize(query)) - STOPWORDS - QUESTION_WORDS:
+            term = term if len(term) < PREFIX_MIN + 2 else term.removesuffix("ing").removesuffix("ed")
+            lo = np.searchsorted(self.vocab, term, side="left")
+            hi = (np.searchsorted(self.vocab, term + "\uffff", side="left") if len(term) >= PREFIX_MIN
+                  else lo + int(lo < len(self.vocab) and self.vocab[lo] == term))
+            ids.extend(range(lo, hi))
+        return np.unique(np.asarray(ids, dtype=np.int64))
+
+    def score(self, query: str):
+        # (text ids, BM25 scores) for every text matching at least one query term
+        terms = self._terms(query)
+        if not len(terms):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        starts, ends = self.indptr[terms], self.indptr[terms + 1]
+        counts = ends - starts
+        offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        pos = np.repeat(starts, counts) + offsets
+        docs, tf = self.post_docs[pos], self.post_tf[pos]
+        contrib = np.repeat(self.idf[terms], counts) * tf * (BM25_K1 + 1) / (tf + self.norm[docs])
+        # every contribution is positive, so the texts with a nonzero total are exactly the matches
+        total = np.bincount(docs, weights=contrib, minlength=len(self.doc_rows))
+        uniq = np.flatnonzero(total > 0)
+        return uniq, total[uniq]
+
+    def top_rows(self, df: pd.DataFrame, query: str, k: int = TOP_ROWS):
+        # best k row positions (with their scores) and how many rows matched at all
+        docs, scores = self.score(query)
+        if not len(docs):
+            return np.empty(0, dtype=np.int64), np.empty(0), 0
+        matched = int(self.doc_rows[docs].sum())
+        # every text has at least one row, so the k best texts always cover k rows
+        order = np.argpartition(-scores, k - 1)[:k] if len(scores) > k else np.arange(len(scores))
+        order = order[np.argsort(-scores[order], kind="stable")]
+        # expand the best texts until at least k rows are in hand, then rank rows within them
+        take = int(np.searchsorted(np.cumsum(self.doc_rows[docs[order]]), k)) + 1
+        best = order[:take]
+        starts, counts = self.text_rows[docs[best]], self.doc_rows[docs[best]]
+        offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        rows = self.rows[np.repeat(starts, counts) + offsets].astype(np.int64)
+        row_scores = np.repeat(scores[best], counts)
+        status = (df["Status"].iloc[rows].astype(str).map(_STATUS_RANK).fillna(2).to_numpy()
+                  if "Status" in df.columns else np.zeros(len(rows)))
+        due = np.zeros(len(rows), dtype=np.int64)
+        if "Due Date" in df.columns:
+            d = df["Due Date"].iloc[rows].to_numpy(dtype="datetime64[ns]")
+            due = np.where(np.isnat(d), np.iinfo(np.int64).max, d.view(np.int64))
+        pick = np.lexsort((due, status, -row_scores))[:k]
+        return rows[pick], row_scores[pick], matched
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _cached_bm25(_df: pd.DataFrame, version: str) -> BM25Index:
+    return BM25Index(_df)
+
+def get_bm25_index(df: pd.DataFrame) -> BM25Index:
+    return _cached_bm25(df, dataset_version(df))
+
+def _line(row: pd.Series) -> str:
+    due = row.get("Due Date")
+    desc = str(row.get("Description", ""))
+    parts = [row.get("Task ID"), row.get("Task"), row.get("Status"), row.get("Priority"), row.get("Assignee"),
+             f"due {due:%Y-%m-%d}" if pd.notna(due) else "no due date", row.get("Epic"),
+             desc if len(desc) <= _DESC_CHARS else desc[:_DESC_CHARS - 1] + "…"]
+    return " | ".join("" if p is None or pd.isna(p) else str(p) for p in parts)
+
+def retrieve_context(df: Optional[pd.DataFrame], question: str, k: int = TOP_ROWS) -> dict:
+    # compact prompt block with the rows most relevant to the question, plus retrieval stats
+    out = {"text": "", "rows": np.empty(0, dtype=np.int64), "matched": 0, "ms": 0.0, "build_seconds": 0.0}
+    if df is None or df.empty or "Task" not in df.columns:
+        return out
+    index = get_bm25_index(df)
+    start = time.perf_counter()
+    rows, _, matched = index.top_rows(df, question, k)
+    out.update(rows=rows, matched=matched, ms=(time.perf_counter() - start) * 1000, build_seconds=index.build_seconds)
+    if len(rows):
+        header = "Task ID | Task | Status | Priority | Assignee | Due | Epic | Description"
+        lines = "\n".join(_line(r) for _, r in df.iloc[rows].iterrows())
+        out["text"] = f"Relevant tasks ({len(rows)} of {matched:,} matching):\n{header}\n{lines}\n"
+    return out
@@ -0,0 +1,216 @@
+import json
+import string
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+SEVERITY_LEVELS = ["Low","Medium","High","Critical"]
+# Risk Sensitivity (1-5) -> threshold factor; 3 reproduces the rule file exactly
+SENSITIVITY_FACTORS = {1: 1.5, 2: 1.25, 3: 1.0, 4: 0.8, 5: 0.6}
+
+# Conditions: {"column", "op", "value"}; value may be "now" or {"days_from_now": n}.
+# "sensitive": true scales a threshold by the sensitivity factor (">" thresholds drop,
+# "<" windows widen as sensitivity rises). Group rules aggregate matching rows per group_by.
+DEFAULT_RULES = [
+    {
+        "name": "Overdue",
+        "when": [{"column": "Due Date", "op": "<", "value": "now"}, {"column": "Status", "op": "!=", "value": "Done"}],
+        "severity": {"from": "Priority", "escalate": {"column": "Due Date", "days_late": 14, "sensitive": True}},
+        "explanation": "Due {Due Date} (status {Status})"
+    },
+    {
+        "name": "Blocked",
+        "when": [{"column": "Status", "op": "==", "value": "Blocked"}],
+        "severity": {"from": "Priority", "min": "Medium"},
+        "explanation": "{Description:.120}"
+    },
+    {
+        "name": "Overloaded",
+        "group_by": "Assignee",
+        "when": [{"column": "Status", "op": "==", "value": "In Progress"}],
+        "aggregate": "count",
+        "op": ">",
+        "threshold": 6,
+        "sensitive": True,
+        "severity": "Medium",
+        "explanation": "{value} tasks In Progress"
+    }
+]
+
+_OPS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "in": lambda a, b: a.isin(b),
+    "not_in": lambda a, b: ~a.isin(b)
+}
+
+_ORDERING = {"<", "<=", ">", ">="}
+
+def parse_rules(text: str, name: str = "rules.json") -> list:
+    # JSON or YAML (YAML needs PyYAML installed); either a list of rules or {"rules": [...]}
+    if Path(name).suffix.lower() in (".yaml", ".yml"):
+        if yaml is None:
+            raise ValueError("YAML rules need PyYAML installed; use JSON instead")
+        rules = yaml.safe_load(text)
+    else:
+        rules = json.loads(text)
+    rules = rules.get("rules", rules) if isinstance(rules, dict) else rules
+    if not isinstance(rules, list) or not all(isinstance(r, dict) and "name" in r for r in rules):
+        raise ValueError("expected a list of rules, each with a name")
+    for r in rules:
+        for c in r.get("when", []):
+            if not isinstance(c, dict) or not {"column", "op", "value"} <= c.keys():
+                raise ValueError(f"Rule {r['name']}: each condition needs column, op and value")
+            if c["op"] not in _OPS:
+                raise ValueError(f"Rule {r['name']}: unsupported operator {c['op']!r}")
+        severity = r.get("severity", "Medium")
+        levels = [severity] if isinstance(severity, str) else [severity.get("min", "Low")] if isinstance(severity, dict) else [None]
+        if any(level not in SEVERITY_LEVELS for level in levels):
+            raise ValueError(f"Rule {r['name']}: severity must be one of {SEVERITY_LEVELS}")
+    return rules
+
+def load_rules(path) -> list:
+    return parse_rules(Path(path).read_text(), str(path))
+
+def _scale(value: float, op: str, factor: float) -> float:
+    return value * factor if op in (">", ">=") else value / factor
+
+class RiskEngine:
+    # rules are compiled once; evaluate() computes each distinct predicate a single time per dataset
+    def __init__(self, rules: Optional[list] = None, sensitivity: int = 3):
+        self.factor = SENSITIVITY_FACTORS.get(int(sensitivity), 1.0)
+        self.rules = [self._compile(r) for r in (rules or DEFAULT_RULES)]
+
+    def _compile(self, rule: dict) -> dict:
+        unknown = [c["op"] for c in rule.get("when", []) if c["op"] not in _OPS]
+        if unknown:
+            raise ValueError(f"Rule {rule.get('name')}: unsupported operator(s) {unknown}")
+        conds = []
+        for c in rule.get("when", []):
+            value = c["value"]
+            if isinstance(value, dict) and "days_from_now" in value:
+                days = value["days_from_now"]
+                value = ("days", _scale(days, c["op"], self.factor) if c.get("sensitive") else days)
+            elif c.get("sensitive") and isinstance(value, (int, float)):
+                value = _scale(value, c["op"], self.factor)
+            conds.append((c["column"], c["op"], json.dumps(value, default=str)))
+        threshold = rule.get("threshold")
+        if threshold is not None and rule.get("sensitive"):
+            threshold = _scale(threshold, rule.get("op", ">"), self.factor)
+        severity = rule.get("severity", "Medium")
+        if "group_by" in rule and not isinstance(severity, str):
+            raise ValueError(f"Rule {rule.get('name')}: group rules need a fixed severity level")
+        escalate = severity.get("escalate") if isinstance(severity, dict) else None
+        if escalate and escalate.get("sensitive"):
+            escalate = dict(escalate, days_late=escalate["days_late"] * self.factor)
+        return {**rule, "conds": conds, "threshold": threshold, "escalate": escalate,
+                "fields": [f for _, f, _, _ in string.Formatter().parse(rule.get("explanation", "")) if f]}
+
+    def _predicate(self, df: pd.DataFrame, cache: dict, now: pd.Timestamp, cond) -> np.ndarray:
+        if cond not in cache:
+            column, op, raw = cond
+            value = json.loads(raw)
+            if value == "now":
+                value = now
+            elif isinstance(value, list) and len(value) == 2 and value[0] == "days":
+                value = now + pd.Timedelta(days=value[1])
+            col = df[column]
+            # ordering only makes sense on numbers, dates and ordered categoricals
+            if op in _ORDERING and (col.dtype == object or pd.api.types.is_string_dtype(col.dtype)
+                                    or (isinstance(col.dtype, pd.CategoricalDtype) and not col.cat.ordered)):
+                raise ValueError(f"operator {op!r} needs a numeric, date or ordered column; {column!r} is unordered text")
+            mask = _OPS[op](col, value)
+            cache[cond] = np.asarray(mask, dtype=bool)
+        return cache[cond]
+
+    def _severity(self, df: pd.DataFrame, rows: np.ndarray, rule: dict, now: pd.Timestamp) -> np.ndarray:
+        spec = rule.get("severity", "Medium")
+        if isinstance(spec, str):
+            return np.full(len(rows), SEVERITY_LEVELS.index(spec), dtype=np.int8)
+        col = df[spec.get("from", "Priority")].iloc[rows]
+        sev = np.ones(len(rows), dtype=np.int8)
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            # labels outside the level list (and missing values) stay Medium instead of clipping to an extreme
+            level = np.array([SEVERITY_LEVELS.index(c) if c in SEVERITY_LEVELS else 1 for c in col.cat.categories] + [1], dtype=np.int8)
+            sev = level[col.cat.codes.to_numpy()]
+        if "min" in spec:
+            sev = np.maximum(sev, SEVERITY_LEVELS.index(spec["min"]))
+        esc = rule["escalate"]
+        if esc:
+            late = (now - df[esc["column"]].iloc[rows]).dt.days.to_numpy()
+            sev = sev + (np.nan_to_num(late, nan=0) > esc["days_late"])
+        return np.minimum(sev, 3).astype(np.int8)
+
+    @staticmethod
+    def _explain(template: str, fields: list, values: pd.DataFrame) -> np.ndarray:
+        # format once per distinct combination of referenced values, then fan out by group code
+        if not fields or values.empty:
+            return np.full(len(values), template, dtype=object)
+        keyed = pd.DataFrame({f: values[f].to_numpy() for f in fields})
+        for f in fields:
+            if pd.api.types.is_datetime64_any_dtype(keyed[f]):
+                keyed[f] = keyed[f].dt.floor("D")
+        groups = keyed.groupby(fields, observed=True, dropna=False, sort=False).ngroup().to_numpy()
+        _, firsts = np.unique(groups, return_index=True)
+        labels = np.empty(len(firsts), dtype=object)
+        for g, row in enumerate(keyed.iloc[firsts].to_dict("records")):
+            labels[g] = template.format(**{f: "" if pd.isna(v) else (v.date() if isinstance(v, pd.Timestamp) else v)
+                                           for f, v in row.items()})
+        return labels[groups]
+
+    def evaluate(self, df: pd.DataFrame, now: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        now = pd.Timestamp.now() if now is None else now
+        cache = {}
+        parts = []
+        for rule in self.rules:
+            mask = np.ones(len(df), dtype=bool)
+            for cond in rule["conds"]:
+                mask &= self._predicate(df, cache, now, cond)
+            if "group_by" in rule:
+                key = rule["group_by"]
+                agg = rule.get("aggregate", "count")
+                matched = df[mask]
+                if agg == "count":
+                    values = matched.groupby(key, observed=True).size()
+                else:
+                    values = matched.groupby(key, observed=True)[rule["column"]].agg(agg)
+                values = values[_OPS[rule.get("op", ">")](values, rule["threshold"])]
+                if not len(values):
+                    continue
+                expl = self._explain(rule.get("explanation", rule["name"]), rule["fields"],
+                                     pd.DataFrame({"value": values.to_numpy(), key: values.index.astype(str)}))
+                parts.append(pd.DataFrame({
+                    "task_id": None, "risk_type": rule["name"],
+                    "severity": np.full(len(values), SEVERITY_LEVELS.index(rule.get("severity", "Medium")), dtype=np.int8),
+                    "assignee": values.index.astype(str).to_numpy() if key == "Assignee" else None,
+                    "explanation": expl
+                }))
+            else:
+                rows = np.flatnonzero(mask)
+                if not len(rows):
+                    continue
+                fields = [f for f in rule["fields"] if f in df.columns]
+                parts.append(pd.DataFrame({
+                    "task_id": df["Task ID"].to_numpy()[rows], "risk_type": rule["name"],
+                    "severity": self._severity(df, rows, rule, now),
+                    "assignee": df["Assignee"].iloc[rows].to_numpy() if "Assignee" in df.columns else None,
+                    "explanation": self._explain(rule.get("explanation", rule["name"]), fields, df.iloc[rows][fields])
+                }))
+        if not parts:
+            out = pd.DataFrame({"task_id": [], "risk_type": [], "severity": np.array([], dtype=np.int8), "assignee": [], "explanation": []})
+        else:
+            out = pd.concat(parts, ignore_index=True)
+        out["risk_type"] = out["risk_type"].astype("category")
+        out["severity"] = pd.Categorical.from_codes(out["severity"].to_numpy(dtype=np.int8), categories=SEVERITY_LEVELS, ordered=True)
+        return out
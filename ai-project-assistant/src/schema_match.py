@@ -0,0 +1,104 @@
+import re
+from collections import OrderedDict, defaultdict
+
+# header tokens are matched against synonym tokens; a synonym maps when its score clears this
+MATCH_THRESHOLD = 0.6
+# shared leading letters that make two tokens the same word ("creation" / "created")
+STEM_PREFIX = 5
+MAX_CACHED_SIGNATURES = 256
+# decorations common in tracker exports that carry no meaning for the mapping
+NOISE_TOKENS = {"utc","gmt","link","user","users","name","field","value","est","estimate","custom","cf","the","of","on","at"}
+
+def canon_header(col: str) -> str:
+    # "DueDate" / "Assigned To (User)" / "story_pts" -> "due date" / "assigned to user" / "story pts"
+    col = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", " ", str(col))
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", col.lower()).split())
+
+def _ngrams(token: str, n: int = 3) -> set:
+    padded = f" {token} "
+    return {padded[i:i + n] for i in range(max(1, len(padded) - n + 1))}
+
+def _is_abbrev(short: str, full: str) -> bool:
+    # "pts" -> "points", "desc" -> "description": same first letter, letters appear in order
+    if len(short) < 2 or len(short) >= len(full) or short[0] != full[0]:
+        return False
+    it = iter(full)
+    return all(ch in it for ch in short)
+
+def _same_stem(a: str, b: str) -> bool:
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n >= STEM_PREFIX and n >= 0.6 * min(len(a), len(b))
+
+class SchemaMatcher:
+    def __init__(self, synonyms: dict, threshold: float = MATCH_THRESHOLD):
+        self.threshold = threshold
+        self.synonyms = {canon_header(k): v for k, v in synonyms.items()}
+        # every target name is also its own synonym, so canonical headers always match
+        for target in synonyms.values():
+            self.synonyms.setdefault(canon_header(target), target)
+        self.entries = [(k.split(), v) for k, v in self.synonyms.items()]
+        # precomputed n-gram index: gram -> synonym tokens containing it
+        self.vocab = sorted({t for toks, _ in self.entries for t in toks})
+        self.gram_index = defaultdict(set)
+        for t in self.vocab:
+            for g in _ngrams(t):
+                self.gram_index[g].add(t)
+        self._cache = OrderedDict()
+
+    def _token_sims(self, token: str) -> dict:
+        sims = {}
+        grams = _ngrams(token)
+        for cand in set().union(*(self.gram_index.get(g, ()) for g in grams)):
+            cg = _ngrams(cand)
+            dice = 2 * len(grams & cg) / (len(grams) + len(cg))
+            if dice >= 0.7:
+                sims[cand] = dice
+        for cand in self.vocab:
+            if cand == token:
+                sims[cand] = 1.0
+            elif _is_abbrev(token, cand) or (len(token) >= 3 and cand.startswith(token)):
+                sims[cand] = max(sims.get(cand, 0.0), 0.9)
+            elif _same_stem(token, cand):
+                sims[cand] = max(sims.get(cand, 0.0), 0.8)
+        return sims
+
+    def score(self, header: str):
+        # best (target, score) for one header: how much of the synonym the header covers,
+        # discounted by the share of header tokens the synonym leaves unexplained
+        key = canon_header(header)
+        if key in self.synonyms:
+            return self.synonyms[key], 1.0
+        tokens = [t for t in key.split() if t not in NOISE_TOKENS] or key.split()
+        if not tokens:
+            return None, 0.0
+        token_sims = [self._token_sims(t) for t in tokens]
+        best, best_score = None, 0.0
+        for syn_tokens, target in self.entries:
+            coverage = sum(max(s.get(t, 0.0) for s in token_sims) for t in syn_tokens) / len(syn_tokens)
+            explained = sum(max((s.get(t, 0.0) for t in syn_tokens), default=0.0) for s in token_sims) / len(tokens)
+            sc = coverage * (1 + explained) / 2
+            if sc > best_score:
+                best, best_score = target, sc
+        return (best, best_score) if best_score >= self.threshold else (None, best_score)
+
+    def match(self, headers) -> dict:
+        # header -> {"target", "score"}; cached per header signature so repeat sources skip matching
+        signature = tuple(str(h) for h in headers)
+        if signature in self._cache:
+            self._cache.move_to_end(signature)
+            return self._cache[signature]
+        scored = {h: self.score(h) for h in signature}
+        # each target is claimed once, by the strongest header
+        claimed = {}
+        for h, (target, sc) in sorted(scored.items(), key=lambda kv: -kv[1][1]):
+            if target is not None and target not in claimed:
+                claimed[target] = h
+        mapping = {h: {"target": t if claimed.get(t) == h else None, "score": round(sc, 2)} for h, (t, sc) in scored.items()}
+        self._cache[signature] = mapping
+        if len(self._cache) > MAX_CACHED_SIGNATURES:
+            self._cache.popitem(last=False)
+        return mapping
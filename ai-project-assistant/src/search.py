@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from src.data_loader import dataset_version
+from src.text import csr, tokenize, tokenize_series
+
+TEXT_COLUMNS = ["Task","Description"]
+
+class SearchIndex:
+    # two-level inverted index: token -> distinct texts -> rows. Identical texts (common in tracker
+    # exports) are tokenized once; the vocabulary is sorted so a prefix is a contiguous searchsorted range
+    def __init__(self, df: pd.DataFrame, columns: list = TEXT_COLUMNS):
+        cols = [c for c in columns if c in df.columns]
+        codes = np.zeros(len(df), dtype=np.int64)
+        for c in cols:
+            col = pd.factorize(df[c])[0]
+            codes = codes * (int(col.max()) + 2) + col
+        codes, uniques = pd.factorize(codes)
+        firsts = np.full(len(uniques), len(df), dtype=np.int64)
+        np.minimum.at(firsts, codes, np.arange(len(df)))
+        sub = df.iloc[firsts]
+        text = sub[cols[0]].astype(str) if cols else pd.Series("", index=sub.index)
+        for c in cols[1:]:
+            text = text + " " + sub[c].astype(str)
+        tokens = tokenize_series(text).reset_index(drop=True).explode().dropna()
+        pairs = pd.DataFrame({"token": tokens.to_numpy(), "text": tokens.index.to_numpy()}).drop_duplicates()
+        tok_codes, vocab = pd.factorize(pairs["token"], sort=True)
+        self.vocab = np.asarray(vocab, dtype=str)
+        self.postings, self.post_texts = csr(tok_codes, pairs["text"].to_numpy(), len(self.vocab))
+        self.text_rows, self.rows = csr(codes, np.arange(len(df)), len(uniques))
+        self.n = len(df)
+
+    def _texts_for(self, term: str) -> np.ndarray:
+        # distinct texts containing any token that starts with `term`
+        lo = np.searchsorted(self.vocab, term, side="left")
+        hi = np.searchsorted(self.vocab, term + "\uffff", side="left")
+        if lo == hi:
+            return np.empty(0, dtype=np.int32)
+        found = self.post_texts[self.postings[lo]:self.postings[hi]]
+        return np.unique(found) if hi - lo > 1 else found
+
+    def search(self, query: str) -> np.ndarray:
+        # sorted row positions matching every query term as a token prefix
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return np.arange(self.n)
+        hits = None
+        for term in terms:
+            found = self._texts_for(term)
+            hits = found if hits is None else np.intersect1d(hits, found, assume_unique=True)
+            if not len(hits):
+                return np.empty(0, dtype=np.int64)
+        # expand matching texts to their rows (CSR slices gathered in one shot)
+        starts = self.text_rows[hits]
+        counts = self.text_rows[hits + 1] - starts
+        offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.sort(self.rows[np.repeat(starts, counts) + offsets])
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _cached_index(_df: pd.DataFrame, version: str) -> SearchIndex:
+    # cache_resource hands back the same object on every rerun instead of unpickling a copy
+    return SearchIndex(_df)
+
+def get_search_index(df: pd.DataFrame) -> SearchIndex:
+    return _cached_index(df, dataset_version(df))
+
+def search_rows(df: pd.DataFrame, query: str) -> np.ndarray:
+    return get_search_index(df).search(query)
@@ -0,0 +1,215 @@
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from src.data_loader import dataset_version
+from src.text import STOPWORDS, tokenize_series
+from src.vector_store import (BRUTE_FORCE_DOCS, QUANT_SCALE, assign_lists, get_vector_store, normalize, quantize,
+                               task_texts, train_centroids)
+
+# optional local model; never downloads, only loads what is already in the local model cache
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+LOCAL_MODEL = "all-MiniLM-L6-v2"
+HASH_DIM = 256
+# bump when hashed vectors change for the same text, so stored vectors from older versions are not reused
+HASH_VERSION = 2
+EMBED_BATCH = 65_536
+NPROBE = 32
+REPORTS_DIR = Path(__file__).resolve().parent.parent / "outputs" / "reports"
+REPORT_CHARS = 4000
+_TAGS = re.compile(r"<(script|style)[^>]*>.*?</\1>|<[^>]+>", re.S | re.I)
+
+class HashingEmbedder:
+    # hashed bag of words with signed buckets and sublinear tf, so collisions tend to cancel out.
+    # Stateless: a text always gets the same vector, whatever corpus it is embedded with
+    name = f"hashed-tf-{HASH_DIM}-v{HASH_VERSION}"
+    uses_idf = True
+
+    def __init__(self, dim: int = HASH_DIM):
+        self.dim = dim
+
+    def encode(self, texts) -> np.ndarray:
+        texts = pd.Series(list(texts), dtype=object).fillna("").astype(str)
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for lo in range(0, len(texts), EMBED_BATCH):
+            out[lo:lo + EMBED_BATCH] = self._encode_batch(texts.iloc[lo:lo + EMBED_BATCH].reset_index(drop=True))
+        return out
+
+    def _encode_batch(self, texts: pd.Series) -> np.ndarray:
+        n = len(texts)
+        tokens = tokenize_series(texts).explode().dropna()
+        vecs = np.zeros(n * self.dim, dtype=np.float64)
+        if len(tokens):
+            # stopwords and stemming are applied to the distinct tokens only; light stemming lets
+            # "blocked"/"blocking"/"blocks" share a bucket
+            codes, uniques = pd.factorize(tokens)
+            stems = pd.Series(uniques, dtype=object).str.replace(r"(?<=\w{3})(ing|ed|es|s)$", "", regex=True)
+            h = pd.util.hash_array(stems.to_numpy(dtype=object))
+            bucket = (h % np.uint64(self.dim)).astype(np.int64)
+            sign = np.where((h >> np.uint64(40)) & np.uint64(1), -1.0, 1.0)
+            sign[pd.Series(uniques).isin(STOPWORDS).to_numpy()] = 0.0
+            doc = tokens.index.to_numpy().astype(np.int64)
+            vecs = np.bincount(doc * self.dim + bucket[codes], weights=sign[codes], minlength=n * self.dim)
+            # sublinear tf on the signed bucket counts
+            big = np.abs(vecs) > 1
+            vecs[big] = np.sign(vecs[big]) * (1.0 + np.log(np.abs(vecs[big])))
+        return normalize(vecs.reshape(n, self.dim).astype(np.float32))
+
+class LocalModelEmbedder:
+    # sentence-transformers on CPU, loaded from the local cache only (no network access)
+    uses_idf = False
+
+    def __init__(self, model_name: str = LOCAL_MODEL):
+        self.model = SentenceTransformer(model_name, device="cpu", local_files_only=True)
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = f"st-{model_name}"
+
+    def encode(self, texts) -> np.ndarray:
+        return self.model.encode(list(texts), batch_size=256, normalize_embeddings=True,
+                                 convert_to_numpy=True).astype(np.float32)
+
+@st.cache_resource(show_spinner=False)
+def get_embedder():
+    if SentenceTransformer is not None:
+        try:
+            return LocalModelEmbedder()
+        except Exception:
+            pass
+    return HashingEmbedder()
+
+def _memory_view(df: pd.DataFrame, embedder) -> dict:
+    # same shape as VectorStore.sync, embedding every distinct task text in memory (no persistence)
+    start = time.perf_counter()
+    codes, uniques = pd.factorize(task_texts(df))
+    vectors = quantize(embedder.encode(uniques))
+    centroids, lists = None, np.full(len(uniques), -1, np.int32)
+    if len(uniques) > BRUTE_FORCE_DOCS:
+        centroids = train_centroids(vectors, np.arange(len(uniques)))
+        lists = assign_lists(vectors, centroids)
+    return {"vectors": vectors, "slots": codes.astype(np.int64), "lists": lists[codes], "centroids": centroids,
+            "nonzero": np.count_nonzero(vectors, axis=0), "live": len(uniques), "reused": 0,
+            "embedded": len(uniques), "tombstoned": 0, "seconds": time.perf_counter() - start}
+
+class VectorIndex:
+    # int8 vectors (in memory or memory-mapped from the store) plus an IVF layer: documents are
+    # bucketed by nearest centroid (CSR lists) and a query only scores the lists of its NPROBE closest centroids
+    def __init__(self, vectors: np.ndarray, docs: np.ndarray, centroids: Optional[np.ndarray] = None,
+                 doc_lists: Optional[np.ndarray] = None, nonzero: Optional[np.ndarray] = None, total: int = 0):
+        self.vectors, self.docs = vectors, docs
+        self.n, self.dim = len(docs), vectors.shape[1]
+        self.centroids = centroids if self.n > BRUTE_FORCE_DOCS else None
+        if self.centroids is not None:
+            order = np.argsort(doc_lists, kind="stable")
+            self.indptr = np.zeros(len(centroids) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(doc_lists, minlength=len(centroids)), out=self.indptr[1:])
+            self.ids = docs[order]
+        # document frequency per dimension, used to weight hashed-tf queries like tf-idf
+        if nonzero is None:
+            nonzero, total = np.count_nonzero(vectors[docs], axis=0), self.n
+        self.idf = np.log((1 + total) / (1 + nonzero)).astype(np.float32) + 1
+
+    def _candidates(self, q: np.ndarray, nprobe: int) -> np.ndarray:
+        if self.centroids is None:
+            return self.docs
+        lists = np.argsort(-(self.centroids @ q))[:nprobe]
+        starts, ends = self.indptr[lists], self.indptr[lists + 1]
+        counts = ends - starts
+        offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.sort(self.ids[np.repeat(starts, counts) + offsets])
+
+    def search(self, q: np.ndarray, k: int = 10, nprobe: int = NPROBE):
+        # (vector slots, cosine scores), best first
+        cand = self._candidates(q, nprobe)
+        scores = self.vectors[cand].astype(np.float32) @ (q / QUANT_SCALE)
+        top = np.argpartition(-scores, min(k, len(scores)) - 1)[:k] if len(scores) > k else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return cand[top], scores[top]
+
+def _report_docs(reports_dir: Path) -> pd.DataFrame:
+    rows = []
+    for p in sorted(reports_dir.glob("*.htm*")) + sorted(reports_dir.glob("*.md")):
+        text = _TAGS.sub(" ", p.read_text(encoding="utf-8", errors="ignore"))
+        rows.append({"Title": p.stem.replace("_", " "), "Text": " ".join(text.split())[:REPORT_CHARS], "Path": str(p)})
+    return pd.DataFrame(rows, columns=["Title","Text","Path"])
+
+class SemanticIndex:
+    # one vector per distinct task text, from the on-disk store (only texts it has not seen are embedded);
+    # the few saved reports are embedded in memory and scanned exactly
+    def __init__(self, df: pd.DataFrame, reports_dir: Path = REPORTS_DIR, embedder=None, persist: bool = True):
+        self.embedder = embedder or get_embedder()
+        start = time.perf_counter()
+        store = get_vector_store(self.embedder.name, self.embedder.dim) if persist else None
+        view = store.sync(df, self.embedder.encode) if store is not None else _memory_view(df, self.embedder)
+        self.persisted = store is not None
+        self.stats = {k: view[k] for k in ("reused","embedded","tombstoned")}
+        docs, first, counts = np.unique(view["slots"], return_index=True, return_counts=True)
+        self.first_row, self.doc_rows = first, counts
+        self.index = VectorIndex(view["vectors"], docs, view["centroids"], view["lists"][first],
+                                 view["nonzero"], view["live"])
+        self.reports = _report_docs(reports_dir)
+        self.report_vectors = self.embedder.encode(self.reports["Title"] + ". " + self.reports["Text"])
+        self.build_seconds = time.perf_counter() - start
+
+    def embed_query(self, query: str) -> np.ndarray:
+        q = self.embedder.encode([query])[0]
+        if self.embedder.uses_idf:
+            q = q * self.index.idf
+        return normalize(q[None, :])[0]
+
+    def search(self, df: pd.DataFrame, query: str, k: int = 10) -> pd.DataFrame:
+        cols = ["Kind","Title","Score","Tasks","Row","Path"]
+        q = self.embed_query(query)
+        if not q.any():
+            return pd.DataFrame(columns=cols)
+        slots, scores = self.index.search(q, k)
+        docs = np.searchsorted(self.index.docs, slots)
+        out = [{"Kind": "Task", "Title": f"{df['Task ID'].iat[row]} · {df['Task'].iat[row]}", "Score": float(score),
+                "Tasks": int(n), "Row": int(row), "Path": None}
+               for row, n, score in zip(self.first_row[docs], self.doc_rows[docs], scores)]
+        if len(self.reports):
+            for i, score in enumerate(self.report_vectors @ self.embedder.encode([query])[0]):
+                out.append({"Kind": "Report", "Title": self.reports["Title"].iat[i], "Score": float(score),
+                            "Tasks": 0, "Row": None, "Path": self.reports["Path"].iat[i]})
+        hits = pd.DataFrame(out, columns=cols)
+        hits = hits[hits["Score"] > 0].sort_values("Score", ascending=False, kind="stable").head(k)
+        return hits.assign(Score=hits["Score"].round(3), Row=hits["Row"].astype("Int64")).reset_index(drop=True)
+
+def _reports_signature(reports_dir: Path) -> tuple:
+    return tuple((p.name, p.stat().st_mtime_ns) for p in sorted(reports_dir.glob("*")) if p.is_file()) if reports_dir.exists() else ()
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _cached_semantic(_df: pd.DataFrame, version: str, reports: tuple) -> SemanticIndex:
+    return SemanticIndex(_df)
+
+def get_semantic_index(df: pd.DataFrame) -> SemanticIndex:
+    return _cached_semantic(df, dataset_version(df), _reports_signature(REPORTS_DIR))
+
+def semantic_search_section(df: Optional[pd.DataFrame]):
+    st.markdown("### 🧠 Semantic search")
+    query = st.text_input("Search tasks and past reports", key="semantic_query",
+                          placeholder="e.g. 'payment failures at checkout' or 'what slowed the login work?'")
+    if df is None or not query:
+        return
+    with st.spinner("Building semantic index..."):
+        index = get_semantic_index(df)
+    start = time.perf_counter()
+    hits = index.search(df, query)
+    elapsed = (time.perf_counter() - start) * 1000
+    mode = "exact scan" if index.index.centroids is None else f"IVF {len(index.index.centroids):,} lists, {NPROBE} probed"
+    stats = index.stats
+    store = (f"store: {stats['embedded']:,} embedded, {stats['reused']:,} reused, {stats['tombstoned']:,} tombstoned"
+             if index.persisted else "in-memory vectors")
+    st.caption(f"{index.embedder.name} • {index.index.n:,} documents • {mode} • {store} • built in "
+               f"{index.build_seconds:.1f}s • query {elapsed:.1f} ms")
+    if hits.empty:
+        st.info("No similar tasks or reports found")
+        return
+    st.dataframe(hits[["Kind","Title","Score","Tasks"]], use_container_width=True, hide_index=True)
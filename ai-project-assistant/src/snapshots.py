@@ -0,0 +1,137 @@
+import hashlib
+import time
+import uuid
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+from src.data_loader import STATUS_VOCAB, dataset_version
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / "data" / "snapshots"
+# delta files are folded into history.npz once there are this many
+COMPACT_AFTER = 200
+# status codes: index into STATUS_VOCAB, OTHER for unknown labels, REMOVED for deleted tasks
+OTHER = len(STATUS_VOCAB)
+REMOVED = -1
+DONE = STATUS_VOCAB.index("Done")
+
+def snapshot_key(df: pd.DataFrame, source: Optional[str] = None) -> str:
+    # one store per project: an explicit attrs["snapshot_key"] wins, else the upload source (file name, or
+    # the files behind a "Source" column) plus the set of Task ID prefixes ("PROJ-12" -> "PROJ"), which stays
+    # the same across uploads while tasks come and go. Prefixes alone would lump every numeric-ID project together
+    key = df.attrs.get("snapshot_key")
+    if key:
+        return str(key)
+    if source is None and "Source" in df.columns:
+        source = "|".join(sorted(map(str, df["Source"].dropna().unique())))
+    prefixes = df["Task ID"].astype(str).str.replace(r"[-_ ]*\d+$", "", regex=True).unique()
+    h = hashlib.blake2b((source or "").casefold().encode(), digest_size=8)
+    h.update(b"\0" + "|".join(sorted(map(str, prefixes))).encode())
+    return h.hexdigest()
+
+def snapshot_store(df: pd.DataFrame) -> Path:
+    return SNAPSHOT_DIR / snapshot_key(df)
+
+def _encode(df: pd.DataFrame):
+    df = df.drop_duplicates("Task ID", keep="last")
+    ids = df["Task ID"].astype(str).to_numpy(dtype=str)
+    status = df["Status"].astype(object).map({s: i for i, s in enumerate(STATUS_VOCAB)})
+    codes = status.fillna(OTHER).to_numpy(dtype=np.int8)
+    points = df["Story Points"].to_numpy(dtype=np.int32)
+    return ids, codes, points
+
+def _load_arrays(p: Path) -> dict:
+    with np.load(p) as z:
+        return {k: z[k] for k in z.files}
+
+def record_snapshot(df: pd.DataFrame, store: Optional[Path] = None, ts: Optional[pd.Timestamp] = None) -> int:
+    # append only the tasks whose status/points changed since the last snapshot of this project
+    # (store defaults to snapshot_store(df)); returns rows written
+    if df is None or df.empty:
+        return 0
+    store = store or snapshot_store(df)
+    store.mkdir(parents=True, exist_ok=True)
+    state_path = store / "state.npz"
+    version = dataset_version(df)
+    ids, codes, points = _encode(df)
+    if state_path.exists():
+        state = _load_arrays(state_path)
+        if str(state["version"]) == version:
+            return 0
+        prev = pd.Index(state["ids"])
+        pos = prev.get_indexer(ids)
+        seen = pos >= 0
+        changed = ~seen
+        changed[seen] = (state["codes"][pos[seen]] != codes[seen]) | (state["points"][pos[seen]] != points[seen])
+        gone = ~prev.isin(ids)
+        d_ids = np.concatenate([ids[changed], state["ids"][gone]])
+        d_codes = np.concatenate([codes[changed], np.full(gone.sum(), REMOVED, dtype=np.int8)])
+        d_points = np.concatenate([points[changed], np.zeros(gone.sum(), dtype=np.int32)])
+    else:
+        d_ids, d_codes, d_points = ids, codes, points
+    ts = np.datetime64(ts or pd.Timestamp.now(), "s")
+    if len(d_ids):
+        # write time and a random suffix keep names unique (and in write order) for equal snapshot times
+        name = f"delta-{ts.astype(np.int64):012d}-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.npz"
+        np.savez_compressed(store / name, ts=ts, ids=d_ids, codes=d_codes, points=d_points)
+    np.savez(state_path, version=np.array(version), ids=ids, codes=codes, points=points)
+    if len(list(store.glob("delta-*.npz"))) >= COMPACT_AFTER:
+        compact_snapshots(store)
+    return len(d_ids)
+
+def _read_events(store: Path) -> dict:
+    parts = []
+    history = store / "history.npz"
+    if history.exists():
+        parts.append(_load_arrays(history))
+    for p in sorted(store.glob("delta-*.npz")):
+        z = _load_arrays(p)
+        z["ts"] = np.full(len(z["ids"]), z["ts"], dtype="datetime64[s]")
+        parts.append(z)
+    if not parts:
+        return {"ts": np.array([], dtype="datetime64[s]"), "ids": np.array([], dtype=str),
+                "codes": np.array([], dtype=np.int8), "points": np.array([], dtype=np.int32)}
+    return {k: np.concatenate([p[k] for p in parts]) for k in ("ts","ids","codes","points")}
+
+def compact_snapshots(store: Path) -> None:
+    # fold delta files into one event log so reads open a single file
+    events = _read_events(store)
+    tmp = store / "history.tmp.npz"
+    np.savez_compressed(tmp, **events)
+    tmp.replace(store / "history.npz")
+    for p in store.glob("delta-*.npz"):
+        p.unlink(missing_ok=True)
+
+def snapshot_count(store: Path) -> int:
+    events = _read_events(store) if store.exists() else None
+    return 0 if events is None else len(np.unique(events["ts"]))
+
+def snapshot_stamp(store: Path) -> float:
+    # changes whenever a snapshot is recorded; cheap cache key for derived series
+    state = store / "state.npz"
+    return state.stat().st_mtime if state.exists() else 0.0
+
+def burndown_series(store: Path, freq: str = "D") -> pd.DataFrame:
+    # remaining / done / scope story points per period, replayed from delta events without a per-row loop
+    if not store.exists():
+        return pd.DataFrame(columns=["remaining","done","scope"])
+    ev = _read_events(store)
+    if not len(ev["ids"]):
+        return pd.DataFrame(columns=["remaining","done","scope"])
+    order = np.lexsort((ev["ts"], ev["ids"]))
+    ids, ts, codes, points = ev["ids"][order], ev["ts"][order], ev["codes"][order], ev["points"][order].astype(np.int64)
+    live = codes != REMOVED
+    values = np.stack([
+        np.where(live & (codes != DONE), points, 0),
+        np.where(codes == DONE, points, 0),
+        np.where(live, points, 0)
+    ], axis=1)
+    # each event contributes its value minus the previous value recorded for the same task
+    first = np.ones(len(ids), dtype=bool)
+    first[1:] = ids[1:] != ids[:-1]
+    prev = np.vstack([np.zeros((1, 3), dtype=np.int64), values[:-1]])
+    prev[first] = 0
+    deltas = pd.DataFrame(values - prev, columns=["remaining","done","scope"], index=pd.DatetimeIndex(ts).floor(freq))
+    series = deltas.groupby(level=0).sum().cumsum()
+    # carry values across periods with no recorded change
+    return series.reindex(pd.date_range(series.index[0], series.index[-1], freq=freq), method="ffill")
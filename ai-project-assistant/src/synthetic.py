@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+STATUSES = ["Todo","In Progress","Done","Blocked","Review"]
+PRIORITIES = ["Low","Medium","High","Critical"]
+PRIORITY_P = [0.3,0.4,0.25,0.05]
+POINTS = [1,2,3,5,8,13]
+POINTS_P = [0.15,0.3,0.25,0.2,0.08,0.02]
+# fixed default start of the date span, so a seed always yields the same rows; pass `base` for data relative to today
+DEFAULT_BASE = datetime(2025, 1, 1)
+
+FIRST_NAMES = ["Alice","Bob","Charlie","Diana","Eve","Frank","Grace","Hiro","Ines","Jon","Kemal","Lena",
+               "Mateo","Nadia","Omar","Priya","Quinn","Rosa","Sven","Tara","Umar","Vera","Wei","Yara"]
+LAST_NAMES = ["Johnson","Smith","Brown","Prince","Wilson","Miller","Garcia","Tanaka","Silva","Novak",
+              "Okafor","Larsen","Rossi","Khan","Dubois","Kim","Murphy","Costa","Berg","Patel"]
+EPIC_AREAS = ["User Management","Payment System","Analytics","Mobile App","API","Search","Notifications",
+              "Billing","Onboarding","Reporting","Integrations","Security","Infrastructure","Checkout"]
+VERBS = ["Implement","Fix","Refactor","Test","Document","Optimize","Migrate","Review","Design","Deploy"]
+OBJECTS = ["login flow","payment retry","dashboard widget","export job","search index","API endpoint",
+           "caching layer","email template","data model","permission check","webhook handler","mobile screen"]
+DETAILS = ["Blocked on upstream team","Needs product sign-off","Follow-up from incident review",
+           "Customer-reported issue","Part of quarterly roadmap","Tech debt cleanup","Performance regression"]
+
+def _names(k: int) -> list:
+    combos = [f"{f} {l}" for l in LAST_NAMES for f in FIRST_NAMES]
+    return combos[:k] if k <= len(combos) else combos + [f"Engineer {i:05d}" for i in range(k - len(combos))]
+
+def _epics(k: int) -> list:
+    return [EPIC_AREAS[i % len(EPIC_AREAS)] + ("" if i < len(EPIC_AREAS) else f" {i // len(EPIC_AREAS) + 1}") for i in range(k)]
+
+def _zipf_p(k: int, a: float) -> np.ndarray:
+    # skewed workload: a few people / epics carry most of the tasks
+    w = 1.0 / np.arange(1, k + 1) ** a
+    return w / w.sum()
+
+def _ids(nums: np.ndarray, prefix: str = "PROJ-", width: int = 7) -> np.ndarray:
+    # zero-padded IDs built digit-by-digit as bytes; far cheaper than per-row string formatting
+    head = np.frombuffer(prefix.encode(), dtype=np.uint8)
+    buf = np.empty((len(nums), len(head) + width), dtype=np.uint8)
+    buf[:, :len(head)] = head
+    for k in range(width):
+        buf[:, len(head) + width - 1 - k] = 48 + (nums // 10 ** k) % 10
+    return buf.view(f"S{buf.shape[1]}").ravel().astype(f"U{buf.shape[1]}").astype(object)
+
+def _cat(codes: np.ndarray, labels: list) -> pd.Categorical:
+    return pd.Categorical.from_codes(codes.astype(np.int32), categories=labels)
+
+def generate_tasks(n_tasks: int, seed: int = 42, start: int = 0, n_assignees: int = 200, n_epics: int = 40,
+                   assignees: Optional[list] = None, epics: Optional[list] = None,
+                   base: Optional[datetime] = None, span_days: int = 365, dependency_rate: float = 0.2,
+                   id_width: Optional[int] = None) -> pd.DataFrame:
+    # fully vectorized; `start` offsets Task IDs so chunks of one dataset line up
+    rng = np.random.default_rng([seed, start])
+    assignees = assignees or _names(n_assignees)
+    epics = epics or _epics(n_epics)
+    base = np.datetime64((base or DEFAULT_BASE).replace(microsecond=0), "s")
+    now = base + np.timedelta64(span_days, "D")
+    idx = np.arange(start, start + n_tasks)
+    id_width = id_width or max(7, len(str(start + n_tasks)))
+
+    titles = [f"{v} {o}" for v in VERBS for o in OBJECTS]
+    descs = [f"{d}." for d in DETAILS] + ["Auto-generated sample task"]
+    assignee = rng.choice(len(assignees), n_tasks, p=_zipf_p(len(assignees), 1.1))
+    epic = rng.choice(len(epics), n_tasks, p=_zipf_p(len(epics), 0.8))
+    points = np.asarray(POINTS, dtype=np.int32)[rng.choice(len(POINTS), n_tasks, p=POINTS_P)]
+
+    # history: created -> last update -> resolved; older tasks are more likely to be done
+    created = base + rng.integers(0, span_days * 86400, n_tasks).astype("timedelta64[s]")
+    age = (now - created).astype(np.int64) / (span_days * 86400)
+    u = rng.random(n_tasks)
+    status = np.select(
+        [u < age * 0.75, u < age * 0.75 + 0.06, u < age * 0.75 + 0.2, u < age * 0.75 + 0.26],
+        [2, 3, 1, 4], default=0)
+    duration = np.ceil(rng.gamma(2.0, 3.0 + 2.0 * points, n_tasks)).astype("timedelta64[D]")
+    due = created + duration
+    updated = created + ((now - created).astype(np.int64) * rng.random(n_tasks)).astype("timedelta64[s]")
+    resolved = np.where(status == 2, updated, np.datetime64("NaT"))
+
+    ids = _ids(idx + 1, width=id_width)
+    # dependencies point at earlier tasks only, so the link graph is always acyclic
+    has_dep = (rng.random(n_tasks) < dependency_rate) & (idx > 0)
+    dep = np.maximum(idx - rng.integers(1, 50, n_tasks), 0)
+    dep_ids = np.full(n_tasks, "", dtype=object)
+    dep_ids[has_dep] = _ids(dep[has_dep] + 1, width=id_width)
+
+    return pd.DataFrame({
+        "Task ID": ids,
+        "Task": _cat(rng.integers(0, len(titles), n_tasks), titles),
+        "Status": _cat(status, STATUSES),
+        "Priority": _cat(rng.choice(len(PRIORITIES), n_tasks, p=PRIORITY_P), PRIORITIES),
+        "Assignee": _cat(assignee, assignees),
+        "Story Points": points,
+        "Created Date": created.astype("datetime64[ns]"),
+        "Due Date": due.astype("datetime64[ns]"),
+        "Epic": _cat(epic, epics),
+        "Description": _cat(rng.integers(0, len(descs), n_tasks), descs),
+        "Updated Date": updated.astype("datetime64[ns]"),
+        "Resolved Date": resolved.astype("datetime64[ns]"),
+        "Depends On": dep_ids
+    })
+
+def iter_synthetic(n_tasks: int, seed: int = 42, chunk_rows: int = 1_000_000, **kwargs) -> Iterator[pd.DataFrame]:
+    kwargs.setdefault("id_width", max(7, len(str(n_tasks))))
+    for start in range(0, n_tasks, chunk_rows):
+        yield generate_tasks(min(chunk_rows, n_tasks - start), seed=seed, start=start, **kwargs)
+
+def write_synthetic(path, n_tasks: int, seed: int = 42, chunk_rows: int = 1_000_000, **kwargs) -> Path:
+    # streams chunks to CSV / JSONL / Parquet so memory stays bounded by chunk_rows
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    suffix = p.suffix.lower()
+    writer = None
+    try:
+        for i, chunk in enumerate(iter_synthetic(n_tasks, seed, chunk_rows, **kwargs)):
+            if suffix == ".parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                # categories differ per chunk; store plain strings so the schema stays fixed
+                table = table.cast(pa.schema([pa.field(f.name, pa.string()) if pa.types.is_dictionary(f.type) else f for f in table.schema]))
+                writer = writer or pq.ParquetWriter(p, table.schema)
+                writer.write_table(table)
+            elif suffix in (".jsonl", ".ndjson"):
+                with open(p, "w" if i == 0 else "a") as f:
+                    chunk.to_json(f, orient="records", lines=True, date_format="iso")
+            else:
+                chunk.to_csv(p, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    finally:
+        if writer is not None:
+            writer.close()
+    return p
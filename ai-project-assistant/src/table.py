@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from src.data_loader import dataset_version
+
+PAGE_SIZES = [25, 50, 100, 250]
+# below this share of the frame, a filtered view is sorted by its ranks; above it, the full permutation is masked
+RANK_SORT_SHARE = 0.125
+
+def _sort_keys(s: pd.Series) -> np.ndarray:
+    # one comparable int64/float key per row; missing values get the largest key so they sort last
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # codes follow category order (often first appearance); rank them by label unless the order is meaningful
+        codes = s.cat.codes.to_numpy().astype(np.int64)
+        if len(s.cat.categories) == 0:
+            return np.full(len(s), np.iinfo(np.int64).max)
+        rank = (np.arange(len(s.cat.categories)) if s.cat.ordered
+                else np.argsort(np.argsort(s.cat.categories.astype(str), kind="stable")))
+        return np.where(codes < 0, np.iinfo(np.int64).max, rank[codes])
+    if pd.api.types.is_datetime64_any_dtype(s):
+        keys = s.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        return np.where(s.isna().to_numpy(), np.iinfo(np.int64).max, keys)
+    if pd.api.types.is_numeric_dtype(s):
+        keys = s.to_numpy(dtype=np.float64)
+        return np.where(np.isnan(keys), np.inf, keys)
+    keys = pd.factorize(s.astype(str).where(s.notna()), sort=True)[0].astype(np.int64)
+    return np.where(keys < 0, np.iinfo(np.int64).max, keys)
+
+class SortIndex:
+    # per-column sort permutations, computed on first use and kept for the dataset version
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.n = len(df)
+        self._perm, self._rank = {}, {}
+
+    def permutation(self, col: str, ascending: bool = True):
+        key = (col, ascending)
+        if key not in self._perm:
+            keys = _sort_keys(self.df[col])
+            if not ascending:
+                missing = keys == (np.inf if keys.dtype.kind == "f" else np.iinfo(np.int64).max)
+                keys = np.where(missing, keys, -keys)
+            perm = np.argsort(keys, kind="stable")
+            rank = np.empty(self.n, dtype=np.int64)
+            rank[perm] = np.arange(self.n)
+            self._perm[key], self._rank[key] = perm, rank
+        return self._perm[key], self._rank[key]
+
+    def sort_rows(self, rows: np.ndarray, col: str, ascending: bool = True) -> np.ndarray:
+        perm, rank = self.permutation(col, ascending)
+        if len(rows) == self.n:
+            return perm
+        if len(rows) < self.n * RANK_SORT_SHARE:
+            return rows[np.argsort(rank[rows], kind="stable")]
+        mask = np.zeros(self.n, dtype=bool)
+        mask[rows] = True
+        return perm[mask[perm]]
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _cached_sort_index(_df: pd.DataFrame, version: str) -> SortIndex:
+    return SortIndex(_df)
+
+def get_sort_index(df: pd.DataFrame) -> SortIndex:
+    return _cached_sort_index(df, dataset_version(df))
+
+def render_paged_table(df: pd.DataFrame, rows: np.ndarray, key: str = "table"):
+    # sorts row positions server-side and sends only the visible page to the browser
+    c1, c2, c3, c4 = st.columns([2, 1, 1, 1])
+    sort_col = c1.selectbox("Sort by", ["(none)"] + list(df.columns), key=f"{key}_sort")
+    descending = c2.checkbox("Descending", value=False, key=f"{key}_desc")
+    page_size = c3.selectbox("Rows per page", PAGE_SIZES, index=1, key=f"{key}_page_size")
+    pages = max(1, -(-len(rows) // page_size))
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = c4.number_input("Page", min_value=1, max_value=pages, value=1, key=f"{key}_page")
+    if sort_col != "(none)" and len(rows) > 1:
+        rows = get_sort_index(df).sort_rows(rows, sort_col, not descending)
+    lo = (page - 1) * page_size
+    window = rows[lo: lo + page_size]
+    st.caption(f"Rows {lo + 1 if len(rows) else 0:,}–{lo + len(window):,} of {len(rows):,} • page {page} of {pages}")
+    st.dataframe(df.iloc[window].reset_index(drop=True), use_container_width=True)
@@ -0,0 +1,22 @@
+import re
+import numpy as np
+import pandas as pd
+
+# word characters in any script, so "über" and "naïve" stay whole; casefold also folds "ß"/"ss" and the like
+TOKEN_PATTERN = r"\w+"
+_TOKEN = re.compile(TOKEN_PATTERN)
+STOPWORDS = {"a","an","and","are","as","at","be","by","for","from","in","is","it","of","on","or","the","this","that","to","with"}
+
+def tokenize(text: str) -> list:
+    return _TOKEN.findall(str(text).casefold())
+
+def tokenize_series(texts: pd.Series) -> pd.Series:
+    # tokenize() for a whole column: one list of tokens per text
+    return texts.str.casefold().str.findall(TOKEN_PATTERN)
+
+def csr(keys: np.ndarray, values: np.ndarray, n: int):
+    # (indptr, values grouped by key 0..n-1 and sorted within each key): postings and text -> rows maps
+    order = np.lexsort((values, keys))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=indptr[1:])
+    return indptr, values[order].astype(np.int32)
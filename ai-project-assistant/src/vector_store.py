@@ -0,0 +1,239 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+VECTOR_DIR = Path(__file__).resolve().parent.parent / "data" / "vectors"
+# unit vectors are stored as int8 with this fixed scale
+QUANT_SCALE = 127.0
+# below this many vectors a query scans them all; above it queries go through IVF lists
+BRUTE_FORCE_DOCS = 20_000
+KMEANS_ITERS = 6
+KMEANS_SAMPLE_PER_LIST = 32
+# compact in the background once tombstones make up this share of the vector file
+COMPACT_DEAD_SHARE = 0.25
+COMPACT_MIN_DEAD = 10_000
+# retrain IVF centroids when the live set has grown this much since they were trained
+RETRAIN_GROWTH = 2.0
+SYNC_BATCH = 65_536
+
+def normalize(x: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    return np.divide(x, norms, out=np.zeros_like(x), where=norms > 0)
+
+def quantize(x: np.ndarray) -> np.ndarray:
+    return np.clip(np.rint(x * QUANT_SCALE), -127, 127).astype(np.int8)
+
+def train_centroids(vectors: np.ndarray, rows: np.ndarray, seed: int = 0) -> np.ndarray:
+    # spherical k-means (sqrt(n) lists) on a sample of `rows`: centroids are renormalized means,
+    # empty lists are reseeded
+    rng = np.random.default_rng(seed)
+    k = int(np.sqrt(len(rows)))
+    pick = np.sort(rng.choice(rows, min(len(rows), k * KMEANS_SAMPLE_PER_LIST), replace=False))
+    sample = vectors[pick].astype(np.float32)
+    centroids = sample[rng.choice(len(sample), k, replace=False)]
+    for _ in range(KMEANS_ITERS):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        empty = np.bincount(assign, minlength=k) == 0
+        sums[empty] = sample[rng.choice(len(sample), int(empty.sum()), replace=False)]
+        centroids = normalize(sums)
+    return centroids
+
+def assign_lists(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    out = np.empty(len(vectors), dtype=np.int32)
+    for lo in range(0, len(vectors), 16_384):
+        out[lo:lo + 16_384] = np.argmax(np.asarray(vectors[lo:lo + 16_384], dtype=np.float32) @ centroids.T, axis=1)
+    return out
+
+def content_hashes(df: pd.DataFrame) -> np.ndarray:
+    # uint64 per row from the embedded text; categoricals hash their categories once and gather by code
+    cols = [c for c in ["Task","Description"] if c in df.columns]
+    return pd.util.hash_pandas_object(df[cols], index=False).to_numpy()
+
+def task_texts(df: pd.DataFrame) -> pd.Series:
+    text = df["Task"].astype(str)
+    if "Description" in df.columns:
+        text = text + ". " + df["Description"].astype(str)
+    return text.reset_index(drop=True)
+
+class VectorStore:
+    # append-only int8 vector file (memory-mapped) plus one metadata archive per generation:
+    # content hash, alive flag and IVF list per slot, the IVF centroids and per-dimension nonzero
+    # counts. A slot holds one distinct task text; every row with that text maps to it. The archive is replaced atomically and is the commit point of every update;
+    # compaction rewrites live vectors into the next generation's file
+    def __init__(self, root: Path, dim: int):
+        self.root, self.dim = Path(root), dim
+        self._lock = threading.RLock()
+        self._compacting = False
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _vec_path(self, gen: int) -> Path:
+        return self.root / f"vectors-{gen}.i8"
+
+    def _load(self):
+        meta = self.root / "meta.npz"
+        if meta.exists():
+            try:
+                with np.load(meta) as z:
+                    if int(z["dim"]) != self.dim:
+                        raise ValueError("dimension changed")
+                    self.gen, self.count, self.trained_on = int(z["gen"]), int(z["count"]), int(z["trained_on"])
+                    self.content, self.alive = z["content"], z["alive"]
+                    self.lists, self.nonzero = z["lists"], z["nonzero"]
+                    self.centroids = z["centroids"] if len(z["centroids"]) else None
+                self._map()
+                return
+            except Exception:
+                pass
+        # fresh (or unreadable) store
+        self.gen, self.count, self.trained_on = 0, 0, 0
+        self.content = np.empty(0, np.uint64)
+        self.alive, self.lists = np.empty(0, bool), np.empty(0, np.int32)
+        self.nonzero, self.centroids = np.zeros(self.dim, np.int64), None
+        self._vec_path(0).write_bytes(b"")
+        self._map()
+
+    def _map(self):
+        # only the first `count` rows are committed; bytes past them are from an interrupted update
+        path = self._vec_path(self.gen)
+        with open(path, "r+b") as f:
+            f.truncate(self.count * self.dim)
+        self.vectors = (np.memmap(path, dtype=np.int8, mode="r", shape=(self.count, self.dim))
+                        if self.count else np.empty((0, self.dim), np.int8))
+
+    def _save(self):
+        tmp = self.root / "meta.tmp.npz"
+        np.savez(tmp, gen=self.gen, count=self.count, trained_on=self.trained_on, dim=self.dim,
+                 content=self.content, alive=self.alive, lists=self.lists, nonzero=self.nonzero,
+                 centroids=self.centroids if self.centroids is not None else np.empty((0, self.dim), np.float32))
+        os.replace(tmp, self.root / "meta.npz")
+
+    @property
+    def live(self) -> int:
+        return int(self.alive.sum())
+
+    def _append(self, vecs: np.ndarray):
+        with open(self._vec_path(self.gen), "ab") as f:
+            f.write(np.ascontiguousarray(vecs).tobytes())
+
+    def sync(self, df: pd.DataFrame, embed) -> dict:
+        # makes the store mirror df's distinct texts: known ones keep their vectors, new ones are embedded
+        # once however many rows share them, texts no row uses any more are tombstoned (and revived if they
+        # come back). Returns a consistent view (with each row's slot) for building an index
+        start = time.perf_counter()
+        codes, content = pd.factorize(content_hashes(df))
+        content = np.asarray(content, dtype=np.uint64)
+        with self._lock:
+            live = np.flatnonzero(self.alive)
+            # tombstoned slots stay matchable until compaction, so switching back to a dataset revives them;
+            # live slots sort first among equal hashes
+            order = np.lexsort((~self.alive, self.content))
+            stored = self.content[order]
+            # sorted needles keep the binary searches cache friendly
+            cord = np.argsort(content)
+            pos = np.empty(len(content), dtype=np.int64)
+            pos[cord] = np.minimum(np.searchsorted(stored, content[cord]), max(len(order) - 1, 0))
+            found = stored[pos] == content if len(order) else np.zeros(len(content), bool)
+            slot_of = np.where(found, order[pos] if len(order) else -1, -1).astype(np.int64)
+            seen = np.zeros(self.count, bool)
+            seen[slot_of[found]] = True
+            dead = live[~seen[live]]
+            revive = slot_of[found][~self.alive[slot_of[found]]]
+            todo = np.flatnonzero(~found)
+            # factorize numbers texts by first appearance, so the first occurrences are each text's row
+            firsts = np.flatnonzero(~pd.Series(codes).duplicated().to_numpy())
+            texts = task_texts(df.iloc[firsts[todo]]) if len(todo) else None
+            base = self.count
+            new_lists = []
+            for lo in range(0, len(todo), SYNC_BATCH):
+                vecs = quantize(embed(list(texts.iloc[lo:lo + SYNC_BATCH])))
+                self._append(vecs)
+                self.nonzero += np.count_nonzero(vecs, axis=0)
+                new_lists.append(assign_lists(vecs, self.centroids) if self.centroids is not None
+                                 else np.full(len(vecs), -1, np.int32))
+                self.count += len(vecs)
+            slot_of[todo] = base + np.arange(len(todo))
+            if len(dead):
+                self.alive[dead] = False
+                for lo in range(0, len(dead), SYNC_BATCH):
+                    self.nonzero -= np.count_nonzero(self.vectors[dead[lo:lo + SYNC_BATCH]], axis=0)
+            if len(revive):
+                self.alive[revive] = True
+                for lo in range(0, len(revive), SYNC_BATCH):
+                    self.nonzero += np.count_nonzero(self.vectors[revive[lo:lo + SYNC_BATCH]], axis=0)
+                # lists of dead slots are dropped when centroids are retrained
+                stale = revive[self.lists[revive] < 0] if self.centroids is not None else revive[:0]
+                if len(stale):
+                    self.lists[stale] = assign_lists(self.vectors[stale], self.centroids)
+            self.content = np.r_[self.content, content[todo]]
+            self.alive = np.r_[self.alive, np.ones(len(todo), bool)]
+            self.lists = np.concatenate([self.lists, *new_lists]).astype(np.int32)
+            self._map()
+            self._maybe_train()
+            self._save()
+            slots = slot_of[codes]
+            view = {"vectors": self.vectors, "slots": slots, "lists": self.lists[slots], "centroids": self.centroids,
+                    "nonzero": self.nonzero.copy(), "live": self.live, "reused": int(found.sum()),
+                    "revived": len(revive), "embedded": len(todo), "tombstoned": len(dead), "seconds": time.perf_counter() - start}
+        self._maybe_compact()
+        return view
+
+    def _maybe_train(self):
+        live = self.live
+        if live <= BRUTE_FORCE_DOCS or (self.centroids is not None and live < self.trained_on * RETRAIN_GROWTH):
+            return
+        idx = np.flatnonzero(self.alive)
+        self.centroids = train_centroids(self.vectors, idx)
+        self.lists = np.full(self.count, -1, np.int32)
+        for lo in range(0, len(idx), SYNC_BATCH):
+            part = idx[lo:lo + SYNC_BATCH]
+            self.lists[part] = assign_lists(self.vectors[part], self.centroids)
+        self.trained_on = live
+
+    def _maybe_compact(self):
+        dead = self.count - self.live
+        if dead >= COMPACT_MIN_DEAD and dead >= self.count * COMPACT_DEAD_SHARE and not self._compacting:
+            self._compacting = True
+            threading.Thread(target=self.compact, daemon=True, name="vector-compact").start()
+
+    def compact(self):
+        # copies live vectors into the next generation's file; indexes built earlier keep reading the
+        # previous file, which is removed only at the following compaction
+        try:
+            with self._lock:
+                idx = np.flatnonzero(self.alive)
+                gen = self.gen + 1
+                with open(self._vec_path(gen), "wb") as f:
+                    for lo in range(0, len(idx), SYNC_BATCH):
+                        f.write(np.ascontiguousarray(self.vectors[idx[lo:lo + SYNC_BATCH]]).tobytes())
+                self.content, self.lists = self.content[idx], self.lists[idx]
+                self.alive = np.ones(len(idx), bool)
+                self.gen, self.count = gen, len(idx)
+                self._map()
+                self._save()
+                for p in self.root.glob("vectors-*.i8"):
+                    if int(p.stem.split("-")[1]) < gen - 1:
+                        try:
+                            p.unlink(missing_ok=True)
+                        except OSError:
+                            # still mapped elsewhere (Windows); retried at the next compaction
+                            pass
+        finally:
+            self._compacting = False
+
+@st.cache_resource(show_spinner=False)
+def get_vector_store(name: str, dim: int) -> Optional[VectorStore]:
+    # one store per embedder, so switching models never mixes vector spaces
+    try:
+        return VectorStore(VECTOR_DIR / name, dim)
+    except OSError:
+        # read-only or full disk: callers fall back to embedding in memory
+        return None
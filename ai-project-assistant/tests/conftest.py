@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# tests import the app's modules as `src.*`, like app.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,16 @@
+import pandas as pd
+
+from src.cube import build_kpi_cube, cube_kpis, reference_time
+from src.kpi import compute_kpis
+from src.synthetic import generate_tasks
+
+
+def test_cube_and_kpis_agree_on_overdue():
+    now = reference_time()
+    df = generate_tasks(5_000, seed=3)
+    # due dates straddling the reference time inside the current hour
+    df.loc[:99, "Due Date"] = now - pd.Timedelta(seconds=30)
+    df.loc[100:199, "Due Date"] = now + pd.Timedelta(seconds=30)
+    cube = build_kpi_cube(df, now)
+    assert cube_kpis(cube)["overdue"] == compute_kpis(df, now)["overdue"]
+    assert reference_time() >= now and now == now.floor("min")
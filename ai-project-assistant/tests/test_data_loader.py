@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+from src.data_loader import concat_compact, invalid_counts, list_data_files, normalize_schema, upsert_tasks
+
+
+def _raw(ids, points, due):
+    return pd.DataFrame({"Task ID": ids, "Task": [f"t{i}" for i in ids], "Story Points": points,
+                         "Created Date": "2024-01-01", "Due Date": due})
+
+
+def test_invalid_values_counted_once_after_upsert():
+    current = normalize_schema(_raw([1, 2, 3, 4], ["x", 2, 3, 5], ["2024-02-01", "bad", "bad", "2024-02-01"]))
+    assert invalid_counts(current) == {"Story Points": 1, "Created Date": 0, "Due Date": 2}
+    # task 4 is fixed, task 5 is new: the kept slices still carry the parent's attrs
+    incoming = normalize_schema(_raw([4, 5], [8, 1], ["2024-03-01", "2024-03-01"]))
+    merged, changes = upsert_tasks(current, incoming, full_snapshot=False)
+    assert list(changes["updated"]) == ["4"] and list(changes["inserted"]) == ["5"]
+    assert invalid_counts(merged) == {"Story Points": 1, "Created Date": 0, "Due Date": 2}
+    # the invalid rows follow their tasks through the reorder
+    assert merged.loc[merged["Story Points"] == 0, "Task ID"].tolist() == ["1"]
+
+
+def test_update_clears_invalid_row():
+    current = normalize_schema(_raw([1, 2], ["x", 2], ["bad", "2024-02-01"]))
+    merged, _ = upsert_tasks(current, normalize_schema(_raw([1], [3], ["2024-02-01"])), full_snapshot=False)
+    assert invalid_counts(merged) == {"Story Points": 0, "Created Date": 0, "Due Date": 0}
+
+
+def test_concat_counts_each_frame_once():
+    a = normalize_schema(_raw([1, 2], ["x", 1], ["bad", "2024-02-01"]))
+    b = normalize_schema(_raw([3], [1], ["bad"]))
+    out = concat_compact([a, a.iloc[1:], b])
+    assert invalid_counts(out) == {"Story Points": 1, "Created Date": 0, "Due Date": 2}
+
+
+def test_date_format_cache_is_bounded(monkeypatch):
+    from src import data_loader
+    monkeypatch.setattr(data_loader, "MAX_DATE_FORMATS", 3)
+    monkeypatch.setattr(data_loader, "_date_formats", data_loader.OrderedDict())
+    for i in range(10):
+        out = data_loader.parse_dates(pd.Series(["2024-01-02", None]), source=f"file{i}.csv", column="Due Date")
+        assert out.iloc[0] == pd.Timestamp("2024-01-02")
+    assert [k[0] for k in data_loader._date_formats] == ["file7.csv", "file8.csv", "file9.csv"]
+
+
+def test_folder_loads_stay_inside_the_data_root(tmp_path):
+    root = tmp_path / "root"
+    (root / "exports").mkdir(parents=True)
+    (root / "exports" / "a.csv").write_text("Task ID\n1\n")
+    (tmp_path / "secret.csv").write_text("x\n")
+    (root / "exports" / "link.csv").symlink_to(tmp_path / "secret.csv")
+    assert [p.name for p in list_data_files("exports", root)] == ["a.csv"]
+    assert [p.name for p in list_data_files(".", root)] == ["a.csv"]
+    for outside in ("..", str(tmp_path), "/etc"):
+        with pytest.raises(ValueError):
+            list_data_files(outside, root)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from src.dependencies import TaskGraph, analyze_dependencies
+
+def _frame(ids, deps, blocked):
+    n = len(ids)
+    return pd.DataFrame({
+        "Task ID": ids, "Task": ["t"] * n, "Assignee": ["a"] * n, "Story Points": [1] * n,
+        "Status": pd.Categorical(["Blocked" if i in blocked else "Todo" for i in ids]),
+        "Created Date": pd.Timestamp("2025-01-01"), "Due Date": pd.Timestamp("2025-01-03"),
+        "Dependencies": deps,
+    })
+
+def _brute_force(n, src, dst, source):
+    adj = [[] for _ in range(n)]
+    for s, d in zip(src, dst):
+        adj[s].append(d)
+    seen, stack = set(), [source]
+    while stack:
+        for t in adj[stack.pop()]:
+            if t not in seen:
+                seen.add(t)
+                stack.append(t)
+    return seen - {source}
+
+def test_diamonds_are_counted_once():
+    ids, deps = [], []
+    for i in range(70):
+        ids += [f"S{i}", f"A{i}", f"B{i}"]
+        deps += [f"A{i - 1},B{i - 1}" if i else "", f"S{i}", f"S{i}"]
+    ids.append("S70")
+    deps.append("A69,B69")
+    result = analyze_dependencies(_frame(ids, deps, {"S0"}))
+    assert result["blocked_impact"]["Downstream"].tolist() == [210]
+    assert result["affected"] == 210
+
+def test_blocked_tasks_in_and_upstream_of_a_cycle():
+    # A -> B -> C -> B is a cycle, C -> D; A and B are blocked
+    df = _frame(["A", "B", "C", "D", "E"], ["", "A,C", "B", "C", ""], {"A", "B"})
+    result = analyze_dependencies(df)
+    impact = result["blocked_impact"].set_index("Task ID")["Downstream"]
+    assert impact["A"] == 3
+    # B reaches C and D, and itself only through the cycle
+    assert impact["B"] == 2
+    assert result["cyclic"] == 3
+    assert result["affected"] == 3
+
+def test_random_cyclic_graphs_match_brute_force():
+    rng = np.random.default_rng(0)
+    n = 300
+    a, b = rng.integers(0, n, 600), rng.integers(0, n, 600)
+    edges = np.unique(np.stack([a[a != b], b[a != b]]), axis=1)
+    graph = TaskGraph.from_edges(edges[0], edges[1], n)
+    assert graph.cyclic().any()
+    sources = rng.choice(n, 40, replace=False)
+    count, _, affected = graph.downstream(sources, np.zeros(n, dtype=bool))
+    reach = [_brute_force(n, edges[0], edges[1], s) for s in sources]
+    assert count.tolist() == [len(r) for r in reach]
+    assert set(np.flatnonzero(affected)) == set().union(*reach)
+
+def test_long_chain_levels():
+    n = 20_000
+    graph = TaskGraph.from_edges(np.arange(n - 1), np.arange(1, n), n)
+    assert graph.levels == n
+    sched = graph.schedule(np.ones(n))
+    assert sched["Critical"].all()
+    count, _, _ = graph.downstream(np.array([0, n - 1]), np.zeros(n, dtype=bool))
+    assert count.tolist() == [n - 1, 0]
@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+
+from src.kpi import merge_intervals, UNASSIGNED
+
+
+def _tasks(lanes):
+    n = len(lanes)
+    created = pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(n) * 10, unit="D")
+    return pd.DataFrame({"Assignee": pd.Series(lanes, dtype="category"),
+                         "Created Date": created, "Due Date": created + pd.Timedelta(days=2),
+                         "Story Points": np.arange(1, n + 1, dtype=float)})
+
+
+def test_missing_lanes_get_their_own_bar():
+    bars = merge_intervals(_tasks(["Ana", None, "Yara", None]), "Assignee")
+    points = bars.groupby("Assignee")["Points"].sum()
+    assert points.to_dict() == {"Ana": 1.0, "Yara": 3.0, UNASSIGNED: 6.0}
+
+
+def test_all_missing_lanes():
+    bars = merge_intervals(_tasks([None, None, None]), "Assignee")
+    assert set(bars["Assignee"]) == {UNASSIGNED}
+    assert bars["Tasks"].sum() == 3
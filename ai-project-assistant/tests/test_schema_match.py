@@ -0,0 +1,30 @@
+import pytest
+
+from src.data_loader import SYNONYMS
+from src.schema_match import SchemaMatcher
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return SchemaMatcher(SYNONYMS)
+
+
+@pytest.mark.parametrize("header", ["Created Date", "CreatedDate", "Date Created", "created_on", "Creation Date"])
+def test_created_date_variants(matcher, header):
+    assert matcher.score(header)[0] == "Created Date"
+
+
+@pytest.mark.parametrize("target", sorted(set(SYNONYMS.values())))
+def test_target_names_match_themselves(matcher, target):
+    assert matcher.score(target) == (target, 1.0)
+
+
+def test_unrelated_headers_stay_unmapped(matcher):
+    assert matcher.score("Sprint")[0] is None
+    assert matcher.score("Reporter")[0] is None
+
+
+def test_each_target_claimed_once(matcher):
+    mapping = matcher.match(["Created", "Date Created", "Due Date"])
+    targets = [m["target"] for m in mapping.values() if m["target"]]
+    assert sorted(targets) == ["Created Date", "Due Date"]
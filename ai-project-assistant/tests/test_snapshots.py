@@ -0,0 +1,28 @@
+import pandas as pd
+
+from src.data_loader import normalize_schema
+from src.snapshots import snapshot_key, snapshot_store
+
+
+def _project(ids):
+    return normalize_schema(pd.DataFrame({"Task ID": ids, "Task": "t", "Status": "Todo"}))
+
+
+def test_numeric_id_projects_get_separate_stores():
+    a, b = _project([1, 2, 3]), _project([7, 8, 9])
+    assert snapshot_key(a, "billing.csv") != snapshot_key(b, "mobile.csv")
+    # the same source keeps its store while tasks come and go
+    assert snapshot_key(a, "billing.csv") == snapshot_key(b, "Billing.csv")
+
+
+def test_key_follows_the_frame():
+    df = _project([1, 2])
+    df.attrs["snapshot_key"] = snapshot_key(df, "billing.csv")
+    assert snapshot_store(df.iloc[:1]).name == snapshot_key(_project([5]), "billing.csv")
+
+
+def test_source_column_keys_portfolios():
+    a, b = _project([1, 2]), _project([1, 2])
+    a["Source"] = pd.Categorical(["x.csv", "y.csv"])
+    b["Source"] = pd.Categorical(["x.csv", "z.csv"])
+    assert snapshot_key(a) != snapshot_key(b)
@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+from src.table import SortIndex, _sort_keys
+
+
+def test_all_missing_categorical_sorts_without_categories():
+    s = pd.Series([None, None, None], dtype="category")
+    assert (_sort_keys(s) == np.iinfo(np.int64).max).all()
+    index = SortIndex(pd.DataFrame({"Assignee": s}))
+    for ascending in (True, False):
+        assert index.sort_rows(np.arange(3), "Assignee", ascending).tolist() == [0, 1, 2]
+
+
+def test_categorical_missing_sorts_last():
+    s = pd.Series(["b", None, "a"], dtype="category")
+    order = np.argsort(_sort_keys(s), kind="stable")
+    assert order.tolist() == [2, 0, 1]
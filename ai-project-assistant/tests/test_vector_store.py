@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from src.vector_store import VectorStore
+
+
+def _embed(texts):
+    calls.append(len(texts))
+    rng = np.random.default_rng(len(texts))
+    return rng.normal(size=(len(texts), 8)) / 4
+
+
+calls = []
+
+
+def _project(name, n):
+    return pd.DataFrame({"Task": [f"{name} task {i}" for i in range(n)], "Description": ""})
+
+
+def test_switching_back_revives_tombstoned_texts(tmp_path):
+    calls.clear()
+    store = VectorStore(tmp_path, 8)
+    a, b = _project("alpha", 50), _project("beta", 30)
+    first = store.sync(a, _embed)
+    assert store.sync(b, _embed)["tombstoned"] == 50
+    again = store.sync(a, _embed)
+    assert again["embedded"] == 0 and again["revived"] == 50 and again["tombstoned"] == 30
+    assert calls == [50, 30]
+    assert store.live == 50
+    np.testing.assert_array_equal(store.vectors[again["slots"]], store.vectors[first["slots"]])
+    assert store.nonzero.tolist() == np.count_nonzero(store.vectors[again["slots"]], axis=0).tolist()
+    # the revived state survives a reload
+    assert VectorStore(tmp_path, 8).sync(a, _embed)["reused"] == 50
@@ -228,10 +228,9 @@ if 'risk_sensitivity' not in st.session_state:
 
 # Helper Functions
 @st.cache_data
-def generate_sample_data():
+def generate_sample_data(n_tasks=100):
     """Generate sample project data for demonstration"""
     np.random.seed(42)
-    n_tasks = 100
     
     statuses = ['Todo', 'In Progress', 'Done', 'Blocked', 'Review']
     priorities = ['Low', 'Medium', 'High', 'Critical']
@@ -240,14 +239,15 @@ def generate_sample_data():
     base_date = datetime.now() - timedelta(days=60)
     
     data = {
-        'Task ID': [f'PROJ-{i+1:03d}' for i in range(n_tasks)],
-        'Task': [f'Implement feature {chr(65+i%26)} for module {i//10+1}' for i in range(n_tasks)],
+        'Task ID': 'PROJ-' + pd.Series(np.arange(1, n_tasks + 1)).astype(str).str.zfill(3),
+        'Task': 'Implement feature ' + pd.Series(np.array(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ'))[np.arange(n_tasks) % 26])
+                + ' for module ' + pd.Series(np.arange(n_tasks) // 10 + 1).astype(str),
         'Status': np.random.choice(statuses, n_tasks, p=[0.15, 0.35, 0.35, 0.08, 0.07]),
         'Priority': np.random.choice(priorities, n_tasks, p=[0.3, 0.4, 0.25, 0.05]),
         'Assignee': np.random.choice(assignees, n_tasks),
         'Story Points': np.random.choice([1, 2, 3, 5, 8, 13], n_tasks, p=[0.15, 0.3, 0.25, 0.2, 0.08, 0.02]),
-        'Created Date': [base_date + timedelta(days=np.random.randint(0, 50)) for _ in range(n_tasks)],
-        'Due Date': [base_date + timedelta(days=60 + np.random.randint(0, 30)) for _ in range(n_tasks)],
+        'Created Date': base_date + pd.to_timedelta(np.random.randint(0, 50, n_tasks), unit='D'),
+        'Due Date': base_date + pd.to_timedelta(60 + np.random.randint(0, 30, n_tasks), unit='D'),
         'Epic': np.random.choice(['User Management', 'Payment System', 'Analytics', 'Mobile App', 'API'], n_tasks)
     }
     